@@ -3,16 +3,33 @@ AI Adapter – Switch between RuleEngine and LLMEngine.
 """
 
 import os
+from functools import lru_cache
 
 from garage_agent.ai.base_engine import BaseEngine
 from garage_agent.ai.rule_engine import RuleEngine
-from garage_agent.ai.llm_engine import LLMEngine
 
 
+@lru_cache(maxsize=1)
 def get_ai_engine() -> BaseEngine:
+    """Return the process-wide engine; engines are stateless between messages."""
     #engine_type = os.getenv("AI_ENGINE", "rule")
 
     #if engine_type == "llm":
+    # Imported lazily so processes that never build an engine (scheduler
+    # jobs, scripts importing the routes) skip loading the LLM stack.
+    from garage_agent.ai.llm_engine import LLMEngine
+
     return LLMEngine()
 
     #return RuleEngine()
+
+
+async def close_ai_engine() -> None:
+    """Release resources held by the cached engine, if one was created."""
+    if get_ai_engine.cache_info().currsize == 0:
+        return
+
+    engine = get_ai_engine()
+    aclose = getattr(engine, "aclose", None)
+    if aclose is not None:
+        await aclose()
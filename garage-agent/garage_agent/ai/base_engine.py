@@ -3,6 +3,8 @@ from sqlalchemy.orm import Session
 
 
 class BaseEngine(ABC):
+    __slots__ = ()
+
     @abstractmethod
-    def process(self, db: Session, garage_id: int, phone: str, message: str) -> dict:
+    async def process(self, db: Session, garage_id: int, phone: str, message: str) -> dict:
         pass
@@ -0,0 +1,65 @@
+"""
+In-process response cache for deterministic LLM calls.
+
+Every Ollama request is sent with ``temperature=0``, so an identical
+``(model, messages, options)`` payload yields an identical completion.
+Entries are keyed by a SHA-256 of the canonical JSON payload and expire
+after a per-entry TTL; the oldest entries are evicted once the cache is full.
+The same structure backs the short-lived cache of read-only tool results.
+"""
+
+import hashlib
+import time as _time
+from collections import OrderedDict
+from typing import Any
+
+import orjson
+
+
+class LLMCache:
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    @staticmethod
+    def make_key(payload: dict[str, Any]) -> str:
+        """Return a stable hash for a request payload."""
+        canonical = orjson.dumps(
+            payload,
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+        return LLMCache.hash_bytes(canonical)
+
+    @staticmethod
+    def hash_bytes(canonical: bytes) -> str:
+        """Return the cache key for an already-serialized canonical payload."""
+        return hashlib.sha256(canonical).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= _time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (_time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
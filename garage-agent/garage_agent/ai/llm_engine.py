@@ -8,21 +8,35 @@ Responsible for:
 4. Returning structured response payload
 
 Provider: local Ollama instance (HTTP POST to /api/chat).
+
+``process`` is a coroutine: Ollama calls are awaited on the event loop via
+aiohttp, while blocking SQLAlchemy work (history, tool execution, memory
+persistence) runs on a bounded worker pool sized to the DB connection pool.
 """
 
+import asyncio
+import contextvars
+import functools
 import json
 import logging
 import os
 import time as _time
-from datetime import date, datetime, time
-from typing import Any
-
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, time
+from typing import Any, Callable
+
+import aiohttp
+import orjson
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, String, Time
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.orm import Session
 
 from garage_agent.ai.base_engine import BaseEngine
-from garage_agent.ai.rule_engine import RuleEngine
+from garage_agent.ai.llm_cache import LLMCache
+from garage_agent.ai.rule_engine import RuleEngine, match_fast_intent
 from garage_agent.ai.tools.registry import ToolRegistry
+from garage_agent.db.session import DB_POOL_SIZE, Base, SessionLocal, table_write_counts
 from garage_agent.services import ai_memory_service
 
 logger = logging.getLogger(__name__)
@@ -72,17 +86,246 @@ _DEFAULT_OLLAMA_MODEL = "qwen3.5:0.8b"
 _DEFAULT_OLLAMA_NUM_PREDICT = 120
 _DEFAULT_OLLAMA_FOLLOWUP_NUM_PREDICT = 200  # higher limit for follow-up replies
 _DEFAULT_OLLAMA_TIMEOUT = 300          # seconds – generous for CPU inference
+_DEFAULT_OLLAMA_CONNECT_TIMEOUT = 3    # seconds – fail fast when Ollama is down
 _DEFAULT_OLLAMA_KEEP_ALIVE = "30m"     # keep model resident in RAM
 _DEFAULT_OLLAMA_RETRIES = 2            # retry count for transient Ollama failures
+_DEFAULT_OLLAMA_MAX_CONNECTIONS = 16   # pooled keep-alive connections to Ollama
+_DEFAULT_OLLAMA_KEEPALIVE_TIMEOUT = 60  # seconds an idle pooled connection is kept
 _DEFAULT_MEMORY_MESSAGE_LIMIT = 10
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_DEFAULT_BATCH_CONCURRENCY = 4         # parallel messages in process_many
+_DEFAULT_RESPONSE_CACHE_SIZE = 512
+_DEFAULT_RESPONSE_CACHE_TTL = 3600     # seconds – tool-selection responses
+_DEFAULT_FOLLOWUP_CACHE_TTL = 300      # seconds – replies built from tool results
+_DEFAULT_DECISION_CACHE_TTL = 300      # seconds – planner picks of read-only tools
+_DEFAULT_TOOL_RESULT_CACHE_SIZE = 1024
+# Tables read by the cacheable (read-only) tools; a commit touching any of
+# them retires cached tool results.
+_TOOL_RESULT_SOURCE_TABLES = ("bookings", "job_cards", "vehicles")
+
+
+# ---------------------------------------------------------------------------
+# Deterministic reply templates
+# ---------------------------------------------------------------------------
+# Structured tool results are rendered locally instead of paying for a second
+# Ollama round-trip. Tools without a template (or whose result does not fit
+# the template) still get an LLM-written follow-up.
+
+def _format_time(value: Any) -> str:
+    # Serialized times arrive as "HH:MM:SS"; customers only need HH:MM.
+    return str(value)[:5]
+
+
+def _render_create_booking_reply(result: dict) -> str:
+    return (
+        f"Your {result['service_type']} appointment is booked for "
+        f"{result['service_date']} at {_format_time(result['service_time'])}. "
+        f"Booking ID: {result['id']}."
+    )
+
+
+def _render_reschedule_booking_reply(result: dict) -> str:
+    return (
+        f"Your booking #{result['id']} has been moved to "
+        f"{result['service_date']} at {_format_time(result['service_time'])}."
+    )
+
+
+def _render_cancel_booking_reply(result: dict) -> str:
+    return f"Your booking #{result['id']} has been cancelled."
+
+
+def _render_create_jobcard_reply(result: dict) -> str:
+    return f"Work has started on booking #{result['booking_id']} (job card #{result['id']})."
+
+
+def _render_complete_jobcard_reply(result: dict) -> str:
+    return f"Job card #{result['id']} is complete. Your vehicle is ready."
+
+
+def _render_daily_summary_reply(result: dict) -> str:
+    return (
+        f"Summary for {result['date']}:\n"
+        f"Bookings: {result['total_bookings']}\n"
+        f"Cancelled: {result['cancelled_bookings']}\n"
+        f"Jobs in progress: {result['in_progress_jobs']}\n"
+        f"Jobs completed: {result['completed_jobs']}\n"
+        f"Revenue: {result['total_revenue']:.2f}"
+    )
+
+
+@functools.singledispatch
+def _json_default(value: Any) -> Any:
+    """
+    ``default=`` hook for orjson/json: converts values the encoders do not
+    handle natively. Dispatch is by type (cached by singledispatch), so each
+    call is a dict lookup rather than an isinstance/hasattr chain. orjson
+    already covers date/datetime/time in C; those handlers are only reached
+    on the stdlib fallback path.
+    """
+    return str(value)
+
+
+@_json_default.register(date)
+@_json_default.register(time)
+def _json_default_temporal(value: date | time) -> str:
+    # datetime is a date subclass and dispatches here too.
+    return value.isoformat()
+
+
+@_json_default.register(set)
+@_json_default.register(frozenset)
+def _json_default_set(value: set | frozenset) -> list:
+    return list(value)
+
+
+def _isoformat_or_none(value: date | time | None) -> str | None:
+    return None if value is None else value.isoformat()
+
+
+def _json_safe_scalar(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return orjson.loads(_dumps_json(value))
+
+
+def _column_converter(column_type: Any) -> Callable[[Any], Any] | None:
+    """Converter for one column's values, or None when they are already JSON-native."""
+    if isinstance(column_type, (Date, DateTime, Time)):
+        return _isoformat_or_none
+    if isinstance(column_type, (String, Integer, Float, Boolean)) and not isinstance(column_type, SAEnum):
+        return None
+    # TypeDecorators, enums, JSON, Numeric, ...: value types are not fixed.
+    return _json_safe_scalar
+
+
+@functools.lru_cache(maxsize=None)
+def _model_serializer(model_class: type) -> Callable[[Any], dict[str, Any]]:
+    """
+    Build a JSON-safe serializer for one mapped class. The column list and
+    per-column conversions are resolved once per class, so serializing a row
+    is a single pass over precomputed (name, key, converter) triples.
+    """
+    fields = tuple(
+        (prop.columns[0].name, prop.key, _column_converter(prop.columns[0].type))
+        for prop in sa_inspect(model_class).column_attrs
+    )
+
+    def serialize(value: Any) -> dict[str, Any]:
+        # Read loaded values straight from the instance state, skipping the
+        # instrumented descriptors. Expired/unloaded columns (e.g. after a
+        # commit) are the only ones that go through getattr and may refresh
+        # from the DB.
+        loaded = sa_inspect(value).dict
+        row = {}
+        for name, key, convert in fields:
+            item = loaded[key] if key in loaded else getattr(value, key)
+            row[name] = item if convert is None else convert(item)
+        return row
+
+    return serialize
+
+
+@_json_default.register(Base)
+def _json_default_model(value: Any) -> dict[str, Any]:
+    return _model_serializer(type(value))(value)
+
+
+def _dumps_json(value: Any) -> bytes:
+    try:
+        return orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        # e.g. integers beyond 64 bits – let the stdlib encoder handle it.
+        return json.dumps(value, default=_json_default, ensure_ascii=False).encode("utf-8")
+
+
+class _JsonObjectScanner:
+    """
+    Incrementally track brace depth of streamed text (ignoring braces inside
+    JSON strings) to detect when the first top-level object has closed.
+    """
+
+    __slots__ = ("depth", "started", "in_string", "escaped")
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, chunk: str) -> bool:
+        """Consume a chunk; return True once the first object is complete."""
+        for char in chunk:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = self.started
+            elif char == "{":
+                self.started = True
+                self.depth += 1
+            elif char == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
+
+
+TOOL_REPLY_TEMPLATES: dict[str, Callable[[dict], str]] = {
+    "create_booking": _render_create_booking_reply,
+    "reschedule_booking": _render_reschedule_booking_reply,
+    "cancel_booking": _render_cancel_booking_reply,
+    "create_jobcard": _render_create_jobcard_reply,
+    "complete_jobcard": _render_complete_jobcard_reply,
+    "get_daily_summary": _render_daily_summary_reply,
+}
 
 
 class LLMEngine(BaseEngine):
+    # One long-lived instance serves every request; slots keep its attribute
+    # lookups off the instance dict.
+    __slots__ = (
+        "registry",
+        "rule_engine",
+        "ollama_base_url",
+        "ollama_max_connections",
+        "model",
+        "system_prompt",
+        "max_memory_messages",
+        "tool_result_prompt",
+        "tool_execution_failure_reply",
+        "tool_empty_result_reply",
+        "response_cache",
+        "decision_cache",
+        "tool_result_cache",
+        "tool_reply_templates",
+        "tool_selection_system_prompt",
+        "_http_session",
+        "_http_session_loop",
+        "db_executor_workers",
+        "_db_executor",
+        "_inflight_calls",
+        "_system_message",
+        "_tool_selection_system_message",
+        "_chat_payload_template",
+        "_chat_options",
+    )
+
     def __init__(self):
         self.registry = ToolRegistry()
         self.rule_engine = RuleEngine()
 
         self.ollama_base_url = os.getenv("OLLAMA_BASE_URL", _DEFAULT_OLLAMA_BASE_URL).rstrip("/")
+        # Size the pool to the server's OLLAMA_NUM_PARALLEL (or the number of
+        # Ollama replicas behind a proxy) so extra calls queue here instead
+        # of opening connections the server would only queue anyway.
+        self.ollama_max_connections = int(
+            os.getenv("OLLAMA_MAX_CONNECTIONS", str(_DEFAULT_OLLAMA_MAX_CONNECTIONS))
+        )
         self.model = os.getenv("OLLAMA_MODEL", _DEFAULT_OLLAMA_MODEL)
 
         self.system_prompt = SYSTEM_PROMPT
@@ -93,6 +336,41 @@ class LLMEngine(BaseEngine):
             "Do not mention internal implementation details."
         )
         self.tool_execution_failure_reply = "I couldn't complete that request. Please try again."
+        self.tool_empty_result_reply = "Done! Your request has been completed."
+        self.response_cache = LLMCache(max_entries=_DEFAULT_RESPONSE_CACHE_SIZE)
+        self.decision_cache = LLMCache(max_entries=_DEFAULT_RESPONSE_CACHE_SIZE)
+        self.tool_result_cache = LLMCache(max_entries=_DEFAULT_TOOL_RESULT_CACHE_SIZE)
+        self.tool_reply_templates = TOOL_REPLY_TEMPLATES
+        # Blocking DB work runs on at most this many threads, so a burst of
+        # webhooks queues here instead of exhausting the connection pool.
+        self.db_executor_workers = int(os.getenv("TOOL_EXEC_WORKERS", str(DB_POOL_SIZE)))
+        self._db_executor: ThreadPoolExecutor | None = None
+        self._http_session: aiohttp.ClientSession | None = None
+        self._http_session_loop: asyncio.AbstractEventLoop | None = None
+        self._inflight_calls: dict[str, asyncio.Future[str]] = {}
+
+        # The registry is static for the process lifetime, so the planner
+        # prompt (system prompt + tool list) only needs to be built once.
+        self.tool_selection_system_prompt = self._build_tool_selection_system_prompt()
+
+        # System messages are identical for every request; build them once and
+        # share them (read-only) across message lists. They stay plain dicts
+        # because the transport JSON-encodes them.
+        self._system_message = {"role": "system", "content": self.system_prompt}
+        self._tool_selection_system_message = {
+            "role": "system",
+            "content": self.tool_selection_system_prompt,
+        }
+
+        # Request fields that never change between calls, plus one shared
+        # options dict per num_predict value; _call_ollama only adds the
+        # per-call messages and stream flag.
+        self._chat_payload_template = {
+            "model": self.model,
+            "think": False,
+            "keep_alive": _DEFAULT_OLLAMA_KEEP_ALIVE,
+        }
+        self._chat_options: dict[int, dict[str, Any]] = {}
 
         logger.info(
             "event=llm_engine_init model=%s base_url=%s",
@@ -104,27 +382,77 @@ class LLMEngine(BaseEngine):
     # Ollama HTTP transport
     # ------------------------------------------------------------------
 
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """
+        Return the engine's pooled HTTP session, creating it on first use.
+
+        One keep-alive connection pool is shared by every Ollama call so
+        requests skip TCP connection setup. aiohttp sessions are bound to an
+        event loop, so a new one is created if the loop has changed (e.g.
+        ``asyncio.run`` in a script) or the old session was closed.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._http_session
+        if session is None or session.closed or self._http_session_loop is not loop:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.ollama_max_connections,
+                    keepalive_timeout=_DEFAULT_OLLAMA_KEEPALIVE_TIMEOUT,
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    total=_DEFAULT_OLLAMA_TIMEOUT,
+                    sock_connect=_DEFAULT_OLLAMA_CONNECT_TIMEOUT,
+                ),
+            )
+            self._http_session = session
+            self._http_session_loop = loop
+        return session
+
+    async def _run_blocking(self, func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        """
+        ``asyncio.to_thread`` equivalent on the engine's bounded DB executor
+        (created on first use). Context variables are propagated the same way.
+        """
+        if self._db_executor is None:
+            self._db_executor = ThreadPoolExecutor(
+                max_workers=self.db_executor_workers,
+                thread_name_prefix="llm-db",
+            )
+        call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self._db_executor, call)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP session and DB executor (call on application shutdown)."""
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+        if self._db_executor is not None:
+            self._db_executor.shutdown(wait=False)
+            self._db_executor = None
+
     def _build_messages(
         self,
         user_message: str,
         history: list[dict[str, str]] | None = None,
-        system_prompt: str | None = None,
+        system_message: dict[str, str] | None = None,
     ) -> list[dict[str, str]]:
-        messages = [{"role": "system", "content": system_prompt or self.system_prompt}]
+        messages = [system_message or self._system_message]
         if history:
             messages.extend(history)
         messages.append({"role": "user", "content": user_message})
         return messages
 
-    def _call_ollama(
+    async def _call_ollama(
         self,
         messages: list[dict[str, str]],
         num_predict: int = _DEFAULT_OLLAMA_NUM_PREDICT,
+        cache_ttl: float = _DEFAULT_RESPONSE_CACHE_TTL,
+        stop_after_json: bool = False,
     ) -> str:
         """
         Send chat messages to the local Ollama instance and return the
-        generated assistant text. Uses ``/api/chat`` with streaming
-        disabled and temperature fixed at 0 for deterministic output.
+        generated assistant text. Uses ``/api/chat`` with temperature
+        fixed at 0 for deterministic output.
 
         Performance knobs (CPU-friendly):
         * ``keep_alive`` – keeps the model loaded in RAM between calls.
@@ -132,35 +460,110 @@ class LLMEngine(BaseEngine):
         * ``num_predict`` – configurable max tokens per call.
         * Automatic retry with exponential backoff for transient failures.
         * Latency is measured and logged on every call.
+
+        The request is awaited, so the event loop keeps serving other
+        webhooks while the model is generating.
+
+        Because temperature is 0, non-empty replies are cached for
+        ``cache_ttl`` seconds keyed on the full request payload; pass
+        ``cache_ttl=0`` to bypass the cache.
+
+        Concurrent calls with the same payload are coalesced onto a single
+        in-flight request.
+
+        With ``stop_after_json`` the reply is streamed and the connection is
+        closed as soon as the first top-level JSON object is complete, so
+        Ollama stops decoding trailing tokens the planner would discard.
         """
         url = f"{self.ollama_base_url}/api/chat"
+        options = self._chat_options.get(num_predict)
+        if options is None:
+            options = self._chat_options.setdefault(
+                num_predict,
+                {"temperature": 0, "num_predict": num_predict},
+            )
         payload = {
-            "model": self.model,
+            **self._chat_payload_template,
             "messages": messages,
-            "stream": False,
-            "options": {
-                "temperature": 0,
-                "num_predict": num_predict,
-            },
-            "think": False,
-            "keep_alive": _DEFAULT_OLLAMA_KEEP_ALIVE
+            "stream": stop_after_json,
+            "options": options,
         }
-        logger.info("event=ollama_call phase=start url=%s model=%s", url, self.model)
+
+        # Serialize once: the same canonical bytes are the request body and
+        # the input to the cache key.
+        body = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        cache_key = LLMCache.hash_bytes(body) if cache_ttl > 0 else None
+        if cache_key is not None:
+            cached_text = self.response_cache.get(cache_key)
+            if cached_text is not None:
+                logger.debug(
+                    "event=ollama_call phase=cache_hit model=%s message_count=%d",
+                    self.model,
+                    len(messages),
+                )
+                return cached_text
+
+        if cache_key is None:
+            return await self._post_ollama_chat(url, body, len(messages), stop_after_json)
+
+        # Identical requests that arrive while a call is in flight (e.g. a
+        # burst of "summary" messages) share that call instead of each
+        # queueing their own generation on the model.
+        loop = asyncio.get_running_loop()
+        pending = self._inflight_calls.get(cache_key)
+        if pending is None or pending.get_loop() is not loop:
+            pending = loop.create_task(
+                self._post_ollama_chat(url, body, len(messages), stop_after_json)
+            )
+            self._inflight_calls[cache_key] = pending
+            pending.add_done_callback(functools.partial(self._forget_inflight_call, cache_key))
+        else:
+            logger.debug(
+                "event=ollama_call phase=coalesced model=%s message_count=%d",
+                self.model,
+                len(messages),
+            )
+
+        generated_text = await asyncio.shield(pending)
+        if generated_text:
+            self.response_cache.set(cache_key, generated_text, ttl=cache_ttl)
+        return generated_text
+
+    def _forget_inflight_call(self, cache_key: str, done: asyncio.Future[str]) -> None:
+        if self._inflight_calls.get(cache_key) is done:
+            del self._inflight_calls[cache_key]
+
+    async def _post_ollama_chat(
+        self,
+        url: str,
+        body: bytes,
+        message_count: int,
+        stop_after_json: bool,
+    ) -> str:
+        """POST one pre-serialized chat request to Ollama, retrying transient failures."""
+        logger.debug("event=ollama_call phase=start url=%s model=%s", url, self.model)
 
         last_error: Exception | None = None
         for attempt in range(1, _DEFAULT_OLLAMA_RETRIES + 1):
             try:
                 start = _time.time()
-                response = requests.post(url, json=payload, timeout=_DEFAULT_OLLAMA_TIMEOUT)
+                async with self._get_http_session().post(
+                    url,
+                    data=body,
+                    headers=_JSON_HEADERS,
+                ) as response:
+                    response.raise_for_status()
+                    if stop_after_json:
+                        generated_text = await self._read_streamed_json_reply(response)
+                    else:
+                        data = orjson.loads(await response.read())
+                        generated_text = data.get("message", {}).get("content", "").strip()
                 duration = _time.time() - start
 
-                response.raise_for_status()
-                data = response.json()
-                generated_text = data.get("message", {}).get("content", "").strip()
                 logger.info(
                     "event=ollama_call phase=success model=%s message_count=%d response_length=%d latency=%.2fs attempt=%d",
                     self.model,
-                    len(messages),
+                    message_count,
                     len(generated_text),
                     duration,
                     attempt,
@@ -176,11 +579,33 @@ class LLMEngine(BaseEngine):
                     str(exc),
                 )
                 if attempt < _DEFAULT_OLLAMA_RETRIES:
-                    _time.sleep(min(2 ** attempt, 4))  # exponential backoff, max 4s
+                    await asyncio.sleep(min(2 ** attempt, 4))  # exponential backoff, max 4s
 
         # All retries exhausted — raise the last error
         raise last_error  # type: ignore[misc]
 
+    @staticmethod
+    async def _read_streamed_json_reply(response: aiohttp.ClientResponse) -> str:
+        """
+        Accumulate NDJSON chunks from a streaming ``/api/chat`` response,
+        returning early once the first JSON object in the reply has closed.
+        Plain-text replies are read until Ollama reports ``done``.
+        """
+        scanner = _JsonObjectScanner()
+        parts: list[str] = []
+        async for line in response.content:
+            if not line.strip():
+                continue
+            chunk = orjson.loads(line)
+            content = chunk.get("message", {}).get("content", "")
+            if content:
+                parts.append(content)
+                if scanner.feed(content):
+                    break
+            if chunk.get("done"):
+                break
+        return "".join(parts).strip()
+
     # ------------------------------------------------------------------
     # Prompt builders
     # ------------------------------------------------------------------
@@ -234,7 +659,7 @@ class LLMEngine(BaseEngine):
         Build a prompt that asks the LLM to compose a customer-friendly
         WhatsApp reply from a tool execution result.
         """
-        tool_result_payload = json.dumps(tool_result, ensure_ascii=False)
+        tool_result_payload = _dumps_json(tool_result).decode("utf-8")
         prompt = (
             f"### ADDITIONAL INSTRUCTIONS\n{self.tool_result_prompt}\n\n"
             f"### ORIGINAL USER MESSAGE\n{user_message}\n\n"
@@ -250,12 +675,12 @@ class LLMEngine(BaseEngine):
     # Main entry point
     # ------------------------------------------------------------------
 
-    def process(self, db: Session, garage_id: int, phone: str, message: str) -> dict:
+    async def process(self, db: Session, garage_id: int, phone: str, message: str) -> dict:
         """
         Ollama-based execution path.
         """
         safe_message = (message or "").strip()
-        logger.info(
+        logger.debug(
             "event=process_start engine=llm phone=%s garage_id=%s",
             phone,
             garage_id,
@@ -264,27 +689,68 @@ class LLMEngine(BaseEngine):
         if not safe_message:
             return self._conversation_response("Please provide more details so I can assist you.")
 
+        # ----- Step 0: Trivial intents (greeting / thanks / help / bye) skip the model -----
+        fast_reply = match_fast_intent(safe_message)
+        if fast_reply is not None:
+            logger.debug("event=tool_decision decision=fast_intent engine=rule")
+            return await self._finalize_response(
+                response=self._response_contract(
+                    engine="rule",
+                    response_type="conversation",
+                    reply=fast_reply,
+                    tool=None,
+                    arguments=None,
+                    result=None,
+                ),
+                phone=phone,
+                garage_id=garage_id,
+                user_message=safe_message,
+            )
+
         # ----- Step 1: Ask model to decide intent / tool -----
-        history = self._load_conversation_history(phone=phone, garage_id=garage_id)
+        history = await self._run_blocking(
+            self._load_conversation_history,
+            phone=phone,
+            garage_id=garage_id,
+        )
         tool_selection_messages = self._build_messages(
             user_message=safe_message,
             history=history,
-            system_prompt=self._build_tool_selection_system_prompt(),
+            system_message=self._tool_selection_system_message,
         )
-        try:
-            logger.info("event=model_call phase=start model=%s", self.model)
-            raw_response = self._call_ollama(tool_selection_messages)
-            logger.info("event=model_call phase=success model=%s", self.model)
-        except Exception as exc:
-            logger.exception("event=model_call phase=error model=%s", self.model)
-            return self._fallback_to_rule(
-                db=db,
-                garage_id=garage_id,
-                phone=phone,
-                message=safe_message,
-                reason="ollama_api_error",
-                error=exc,
-            )
+        # The response cache only hits on an identical history. Repeated
+        # read-only requests ("summary") are answered from a decision cache
+        # keyed on the message alone, scoped to the sender. Only picks that
+        # do not depend on earlier turns are stored there (see Step 3b);
+        # conversational replies never are, since a "yes" answers whatever
+        # the bot asked last.
+        decision_key = LLMCache.make_key(
+            {
+                "model": self.model,
+                "system_prompt": self.tool_selection_system_prompt,
+                "garage_id": garage_id,
+                "phone": phone,
+                "message": safe_message.casefold(),
+            }
+        )
+        raw_response = self.decision_cache.get(decision_key)
+        if raw_response is not None:
+            logger.debug("event=model_call phase=decision_cache_hit model=%s", self.model)
+        else:
+            try:
+                logger.debug("event=model_call phase=start model=%s", self.model)
+                raw_response = await self._call_ollama(tool_selection_messages, stop_after_json=True)
+                logger.debug("event=model_call phase=success model=%s", self.model)
+            except Exception as exc:
+                logger.exception("event=model_call phase=error model=%s", self.model)
+                return await self._fallback_to_rule(
+                    db=db,
+                    garage_id=garage_id,
+                    phone=phone,
+                    message=safe_message,
+                    reason="ollama_api_error",
+                    error=exc,
+                )
 
         # ----- Step 2: Parse the JSON response -----
         try:
@@ -299,7 +765,7 @@ class LLMEngine(BaseEngine):
                     "event=model_call phase=json_fallback_to_plain_text response_length=%d",
                     len(clean_reply),
                 )
-                return self._finalize_response(
+                return await self._finalize_response(
                     response=self._conversation_response(clean_reply),
                     phone=phone,
                     garage_id=garage_id,
@@ -307,7 +773,7 @@ class LLMEngine(BaseEngine):
                 )
             # Truly empty response — fall back to rule engine
             logger.warning("event=model_call phase=json_parse_error raw_response=<empty>")
-            return self._fallback_to_rule(
+            return await self._fallback_to_rule(
                 db=db,
                 garage_id=garage_id,
                 phone=phone,
@@ -320,8 +786,8 @@ class LLMEngine(BaseEngine):
         # ----- Step 3a: Conversational reply (no tool) -----
         if action == "conversation":
             reply = parsed.get("reply", "Request processed.")
-            logger.info("event=tool_decision decision=conversation")
-            return self._finalize_response(
+            logger.debug("event=tool_decision decision=conversation")
+            return await self._finalize_response(
                 response=self._conversation_response(reply),
                 phone=phone,
                 garage_id=garage_id,
@@ -333,7 +799,7 @@ class LLMEngine(BaseEngine):
 
         if not self.registry.has_tool(tool_name):
             logger.warning("event=tool_decision decision=unknown_tool tool=%s", tool_name)
-            return self._fallback_to_rule(
+            return await self._fallback_to_rule(
                 db=db,
                 garage_id=garage_id,
                 phone=phone,
@@ -348,7 +814,7 @@ class LLMEngine(BaseEngine):
             parsed_arguments = self._parse_tool_arguments(raw_arguments)
         except ValueError as exc:
             logger.warning("event=tool_decision decision=argument_parse_error tool=%s", tool_name)
-            return self._fallback_to_rule(
+            return await self._fallback_to_rule(
                 db=db,
                 garage_id=garage_id,
                 phone=phone,
@@ -358,24 +824,33 @@ class LLMEngine(BaseEngine):
             )
 
         arguments = self.registry.sanitize_arguments(tool_name, parsed_arguments)
-        logger.info(
-            "event=tool_decision decision=tool_selected tool=%s argument_keys=%s",
-            tool_name,
-            sorted(arguments.keys()),
-        )
+        if self.registry.is_readonly(tool_name) and not any(
+            key.endswith("_id") for key in arguments
+        ):
+            # Write decisions may lean on earlier turns ("10am works"), and so
+            # may ids the model resolved from them ("how is it now?" ->
+            # vehicle_id), so only read-only picks without ids are safe to
+            # replay without the full history.
+            self.decision_cache.set(decision_key, raw_response, ttl=_DEFAULT_DECISION_CACHE_TTL)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "event=tool_decision decision=tool_selected tool=%s argument_keys=%s",
+                tool_name,
+                sorted(arguments.keys()),
+            )
 
         # ----- Step 4: Execute the tool -----
-        logger.info("event=tool_execution phase=start tool=%s", tool_name)
+        logger.debug("event=tool_execution phase=start tool=%s", tool_name)
         try:
-            tool_execution = self.registry.execute(
-                tool_name=tool_name,
+            tool_execution = await self._run_tool(
                 db=db,
+                tool_name=tool_name,
                 garage_id=garage_id,
-                **arguments,
+                arguments=arguments,
             )
         except Exception:
             logger.exception("event=tool_execution phase=error tool=%s", tool_name)
-            return self._finalize_response(
+            return await self._finalize_response(
                 response=self._tool_execution_failure_response(),
                 phone=phone,
                 garage_id=garage_id,
@@ -388,7 +863,7 @@ class LLMEngine(BaseEngine):
                 tool_name,
                 type(tool_execution).__name__,
             )
-            return self._finalize_response(
+            return await self._finalize_response(
                 response=self._tool_execution_failure_response(),
                 phone=phone,
                 garage_id=garage_id,
@@ -396,7 +871,7 @@ class LLMEngine(BaseEngine):
             )
 
         execution_success = bool(tool_execution.get("success"))
-        logger.info(
+        logger.debug(
             "event=tool_execution phase=finish tool=%s success=%s",
             tool_name,
             execution_success,
@@ -407,7 +882,7 @@ class LLMEngine(BaseEngine):
                 tool_name,
                 tool_execution.get("error"),
             )
-            return self._finalize_response(
+            return await self._finalize_response(
                 response=self._tool_execution_failure_response(),
                 phone=phone,
                 garage_id=garage_id,
@@ -431,6 +906,7 @@ class LLMEngine(BaseEngine):
                 critical_flag = True
 
             escalation_message = None
+            escalation_task = None
             if critical_flag:
                 logger.warning(
                     "CRITICAL VEHICLE CONDITION DETECTED | phone=%s | score=%s | recurring=%s",
@@ -441,23 +917,18 @@ class LLMEngine(BaseEngine):
 
                 vehicle_id = arguments.get("vehicle_id")
                 if vehicle_id is not None:
-                    try:
-                        from garage_agent.services.escalation_service import create_escalation
-
-                        create_escalation(
+                    # The escalation (DB write + staff alert) does not feed
+                    # the reply, so it runs alongside reply persistence
+                    # instead of ahead of it.
+                    escalation_task = asyncio.create_task(
+                        self._create_escalation(
                             db=db,
                             garage_id=garage_id,
+                            phone=phone,
                             vehicle_id=vehicle_id,
-                            reason="Critical health score or repeated issue",
                             health_score=health_score,
                         )
-                    except Exception:
-                        logger.exception(
-                            "event=escalation phase=error phone=%s garage_id=%s vehicle_id=%s",
-                            phone,
-                            garage_id,
-                            vehicle_id,
-                        )
+                    )
                 else:
                     logger.warning(
                         "event=escalation phase=skipped reason=missing_vehicle_id phone=%s",
@@ -484,7 +955,7 @@ class LLMEngine(BaseEngine):
                 f"Recommendation: {recommendation}"
             )
 
-            return self._finalize_response(
+            response = await self._finalize_response(
                 response={
                     "engine": "llm",
                     "type": "intelligence_report",
@@ -498,20 +969,62 @@ class LLMEngine(BaseEngine):
                 garage_id=garage_id,
                 user_message=safe_message,
             )
+            if escalation_task is not None:
+                await escalation_task
+            return response
+
+        # ----- Step 5a: Templated reply (no second model call) -----
+        templated_reply = self._render_tool_reply(tool_name, serialized_result)
+        if templated_reply is not None:
+            logger.debug("event=tool_reply phase=templated tool=%s", tool_name)
+            return await self._finalize_response(
+                response=self._response_contract(
+                    engine="llm",
+                    response_type="tool_call",
+                    reply=templated_reply,
+                    tool=tool_name,
+                    arguments=arguments,
+                    result=serialized_result,
+                    result_is_json_safe=True,
+                ),
+                phone=phone,
+                garage_id=garage_id,
+                user_message=safe_message,
+            )
+
+        # An empty payload from a write gives the model nothing to phrase;
+        # confirm locally. An empty read means "nothing found", which the
+        # follow-up reply must say, and False/0 still carry an answer.
+        if not self.registry.is_readonly(tool_name) and serialized_result in (None, "", [], {}):
+            logger.debug("event=tool_reply phase=empty_result tool=%s", tool_name)
+            return await self._finalize_response(
+                response=self._response_contract(
+                    engine="llm",
+                    response_type="tool_call",
+                    reply=self.tool_empty_result_reply,
+                    tool=tool_name,
+                    arguments=arguments,
+                    result=serialized_result,
+                    result_is_json_safe=True,
+                ),
+                phone=phone,
+                garage_id=garage_id,
+                user_message=safe_message,
+            )
 
-        # ----- Step 5: Generate follow-up reply via Ollama -----
+        # ----- Step 5b: Generate follow-up reply via Ollama -----
         try:
-            logger.info("event=model_call phase=followup_start model=%s tool=%s", self.model, tool_name)
-            final_reply = self._generate_tool_followup_reply(
+            logger.debug("event=model_call phase=followup_start model=%s tool=%s", self.model, tool_name)
+            final_reply = await self._generate_tool_followup_reply(
                 user_message=safe_message,
                 tool_name=tool_name,
                 tool_result=serialized_result,
                 history=history,
             )
-            logger.info("event=model_call phase=followup_success model=%s tool=%s", self.model, tool_name)
+            logger.debug("event=model_call phase=followup_success model=%s tool=%s", self.model, tool_name)
         except Exception as exc:
             logger.exception("event=model_call phase=followup_error model=%s tool=%s", self.model, tool_name)
-            return self._fallback_to_rule(
+            return await self._fallback_to_rule(
                 db=db,
                 garage_id=garage_id,
                 phone=phone,
@@ -520,7 +1033,7 @@ class LLMEngine(BaseEngine):
                 error=exc,
             )
 
-        return self._finalize_response(
+        return await self._finalize_response(
             response=self._response_contract(
                 engine="llm",
                 response_type="tool_call",
@@ -528,30 +1041,128 @@ class LLMEngine(BaseEngine):
                 tool=tool_name,
                 arguments=arguments,
                 result=serialized_result,
+                result_is_json_safe=True,
             ),
             phone=phone,
             garage_id=garage_id,
             user_message=safe_message,
         )
 
+    async def process_many(
+        self,
+        items: list[tuple[int, str, str]],
+        max_concurrency: int = _DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[dict]:
+        """
+        Process a backlog of ``(garage_id, phone, message)`` items
+        concurrently for non-interactive paths (bulk replay, scheduled
+        jobs). A semaphore bounds in-flight Ollama calls so a burst does
+        not starve interactive webhooks. Results are returned in input
+        order; each item gets its own DB session because a Session must
+        not be shared across concurrent tasks.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _process_one(garage_id: int, phone: str, message: str) -> dict:
+            async with semaphore:
+                db = SessionLocal()
+                try:
+                    return await self.process(db=db, garage_id=garage_id, phone=phone, message=message)
+                except Exception:
+                    logger.exception(
+                        "event=process_many phase=item_error phone=%s garage_id=%s",
+                        phone,
+                        garage_id,
+                    )
+                    return self._tool_execution_failure_response()
+                finally:
+                    await self._run_blocking(db.close)
+
+        logger.info(
+            "event=process_many phase=start item_count=%d max_concurrency=%d",
+            len(items),
+            max_concurrency,
+        )
+        return await asyncio.gather(
+            *(_process_one(garage_id, phone, message) for garage_id, phone, message in items)
+        )
+
     # ------------------------------------------------------------------
     # Follow-up reply generation
     # ------------------------------------------------------------------
 
-    def _generate_tool_followup_reply(
+    async def _generate_tool_followup_reply(
         self,
         user_message: str,
         tool_name: str,
         tool_result: Any,
         history: list[dict[str, str]] | None = None,
     ) -> str:
+        # The payload-level cache misses whenever history has grown, but a
+        # reply worded from the same tool result for the same question is
+        # reusable, so it is also cached on (tool, message, result).
+        reply_key = LLMCache.make_key(
+            {
+                "model": self.model,
+                "tool": tool_name,
+                "message": user_message.casefold(),
+                "result": tool_result,
+            }
+        )
+        reply = self.response_cache.get(reply_key)
+        if reply is not None:
+            logger.debug("event=model_call phase=followup_cache_hit tool=%s", tool_name)
+            return reply
+
         prompt = self._build_followup_prompt(user_message, tool_name, tool_result)
-        reply = self._call_ollama(
+        reply = await self._call_ollama(
             self._build_messages(prompt, history=history),
             num_predict=_DEFAULT_OLLAMA_FOLLOWUP_NUM_PREDICT,
+            cache_ttl=_DEFAULT_FOLLOWUP_CACHE_TTL,
         )
+        if reply:
+            self.response_cache.set(reply_key, reply, ttl=_DEFAULT_FOLLOWUP_CACHE_TTL)
         return reply or "Request processed."
 
+    async def _create_escalation(
+        self,
+        db: Session,
+        garage_id: int,
+        phone: str,
+        vehicle_id: int,
+        health_score: int,
+    ) -> None:
+        try:
+            from garage_agent.services.escalation_service import create_escalation
+
+            await self._run_blocking(
+                create_escalation,
+                db=db,
+                garage_id=garage_id,
+                vehicle_id=vehicle_id,
+                reason="Critical health score or repeated issue",
+                health_score=health_score,
+            )
+        except Exception:
+            logger.exception(
+                "event=escalation phase=error phone=%s garage_id=%s vehicle_id=%s",
+                phone,
+                garage_id,
+                vehicle_id,
+            )
+
+    def _render_tool_reply(self, tool_name: str, tool_result: Any) -> str | None:
+        """Render a templated reply, or return None to defer to the LLM."""
+        template = self.tool_reply_templates.get(tool_name)
+        if template is None or not isinstance(tool_result, dict):
+            return None
+
+        try:
+            return template(tool_result)
+        except (KeyError, TypeError, ValueError):
+            logger.warning("event=tool_reply phase=template_error tool=%s", tool_name)
+            return None
+
     def _load_conversation_history(self, phone: str, garage_id: int) -> list[dict[str, str]]:
         try:
             history = ai_memory_service.get_last_messages(
@@ -567,7 +1178,7 @@ class LLMEngine(BaseEngine):
             )
             return []
 
-        logger.info(
+        logger.debug(
             "event=conversation_memory phase=load phone=%s garage_id=%s message_count=%d",
             phone,
             garage_id,
@@ -598,13 +1209,13 @@ class LLMEngine(BaseEngine):
             )
             return
 
-        logger.info(
+        logger.debug(
             "event=conversation_memory phase=save phone=%s garage_id=%s",
             phone,
             garage_id,
         )
 
-    def _finalize_response(
+    async def _finalize_response(
         self,
         response: dict,
         phone: str,
@@ -613,7 +1224,8 @@ class LLMEngine(BaseEngine):
     ) -> dict:
         reply = response.get("reply")
         if isinstance(reply, str):
-            self._persist_conversation_turn(
+            await self._run_blocking(
+                self._persist_conversation_turn,
                 phone=phone,
                 garage_id=garage_id,
                 user_message=user_message,
@@ -648,18 +1260,18 @@ class LLMEngine(BaseEngine):
         if start != -1 and end != -1 and end > start:
             json_str = cleaned[start:end + 1]
             try:
-                parsed = json.loads(json_str)
+                parsed = orjson.loads(json_str)
                 if isinstance(parsed, dict):
                     return parsed
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 pass
 
         # Last resort: try the whole string
         try:
-            parsed = json.loads(cleaned)
+            parsed = orjson.loads(cleaned)
             if isinstance(parsed, dict):
                 return parsed
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pass
 
         raise ValueError(f"Could not extract valid JSON object from LLM response: {text[:200]}")
@@ -668,7 +1280,7 @@ class LLMEngine(BaseEngine):
     # Fallback & response helpers (unchanged from original)
     # ------------------------------------------------------------------
 
-    def _fallback_to_rule(
+    async def _fallback_to_rule(
         self,
         db: Session,
         garage_id: int,
@@ -684,7 +1296,7 @@ class LLMEngine(BaseEngine):
         )
 
         try:
-            response = self.rule_engine.process(
+            response = await self.rule_engine.process(
                 db=db,
                 garage_id=garage_id,
                 phone=phone,
@@ -755,22 +1367,25 @@ class LLMEngine(BaseEngine):
         tool: Any,
         arguments: Any,
         result: Any,
+        result_is_json_safe: bool = False,
     ) -> dict:
         normalized_type = response_type if response_type in {"conversation", "tool_call"} else "conversation"
         normalized_reply = reply.strip() if isinstance(reply, str) else ""
         if not normalized_reply:
             normalized_reply = "Request processed."
 
-        normalized_tool = tool if isinstance(tool, str) and tool.strip() else None
-        normalized_arguments = self._make_json_safe(arguments) if isinstance(arguments, dict) else None
-        if normalized_arguments is not None and not isinstance(normalized_arguments, dict):
-            normalized_arguments = None
-
-        if normalized_type != "tool_call":
-            normalized_tool = None
-            normalized_arguments = None
+        normalized_tool = None
+        normalized_arguments = None
+        if normalized_type == "tool_call":
+            normalized_tool = tool if isinstance(tool, str) and tool.strip() else None
+            if isinstance(arguments, dict):
+                normalized_arguments = self._json_safe_arguments(arguments)
 
-        normalized_result = self._make_json_safe(result) if result is not None else None
+        # Tool-call paths pass the already-serialized tool result.
+        if result is None or result_is_json_safe:
+            normalized_result = result
+        else:
+            normalized_result = self._make_json_safe(result)
 
         return {
             "engine": engine,
@@ -781,6 +1396,18 @@ class LLMEngine(BaseEngine):
             "result": normalized_result,
         }
 
+    @staticmethod
+    def _json_safe_arguments(arguments: dict[str, Any]) -> dict[str, Any]:
+        """
+        Sanitized arguments are a flat dict of decoded JSON values plus the
+        date/time objects produced by the registry's coercers, so a single
+        pass converting those is enough; anything else takes the full path.
+        """
+        return {
+            key: value.isoformat() if isinstance(value, (date, time)) else _json_safe_scalar(value)
+            for key, value in arguments.items()
+        }
+
     def _parse_tool_arguments(self, raw_arguments: Any) -> dict:
         if isinstance(raw_arguments, dict):
             return raw_arguments
@@ -790,8 +1417,8 @@ class LLMEngine(BaseEngine):
             raise ValueError(f"Tool arguments must be dict or JSON string, got {type(raw_arguments)!r}")
 
         try:
-            parsed = json.loads(raw_arguments)
-        except json.JSONDecodeError as exc:
+            parsed = orjson.loads(raw_arguments)
+        except orjson.JSONDecodeError as exc:
             raise ValueError(f"Invalid JSON tool arguments: {raw_arguments}") from exc
 
         if not isinstance(parsed, dict):
@@ -799,46 +1426,81 @@ class LLMEngine(BaseEngine):
 
         return parsed
 
-    def execute_tool(self, db: Session, tool_name: str, args: dict, garage_id: int):
+    async def execute_tool(self, db: Session, tool_name: str, args: dict, garage_id: int):
         """Executes tool via registry safely."""
         logger.info("event=tool_execution phase=external_execute tool=%s", tool_name)
-        return self.registry.execute(
+        return await self._run_tool(db=db, tool_name=tool_name, garage_id=garage_id, arguments=args)
+
+    async def _run_tool(
+        self,
+        db: Session,
+        tool_name: str,
+        garage_id: int,
+        arguments: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Execute a registry tool off the event loop.
+
+        Successful results of read-only tools are cached per
+        ``(tool, garage, arguments, day)`` for the TTL the registry assigns to
+        the tool. The key also carries the commit counts of the tables those
+        tools read, so a booking or job card change committed anywhere in
+        this process retires older entries; writes from other processes are
+        picked up once the TTL expires.
+        """
+        cache_ttl = self.registry.get_cache_ttl(tool_name)
+        cache_key = None
+        if cache_ttl > 0:
+            cache_key = LLMCache.make_key(
+                {
+                    "tool": tool_name,
+                    "garage_id": garage_id,
+                    "arguments": arguments,
+                    # Tools default missing dates to today.
+                    "today": date.today(),
+                    "data_version": [
+                        table_write_counts[table_name]
+                        for table_name in _TOOL_RESULT_SOURCE_TABLES
+                    ],
+                }
+            )
+            cached_execution = self.tool_result_cache.get(cache_key)
+            if cached_execution is not None:
+                logger.debug("event=tool_execution phase=cache_hit tool=%s", tool_name)
+                return cached_execution
+
+        tool_execution = await self._run_blocking(
+            self.registry.execute,
             tool_name=tool_name,
             db=db,
             garage_id=garage_id,
-            **args,
+            **arguments,
         )
 
-    def _make_json_safe(self, value: Any) -> Any:
-        if value is None or isinstance(value, (str, int, float, bool)):
-            return value
-
-        if isinstance(value, (date, datetime, time)):
-            return value.isoformat()
+        if cache_key is not None and isinstance(tool_execution, dict) and tool_execution.get("success"):
+            self.tool_result_cache.set(cache_key, tool_execution, ttl=cache_ttl)
 
-        if isinstance(value, dict):
-            return {
-                str(key): self._make_json_safe(item)
-                for key, item in value.items()
-            }
-
-        if isinstance(value, (list, tuple, set)):
-            return [self._make_json_safe(item) for item in value]
+        return tool_execution
 
-        if hasattr(value, "__table__") and hasattr(value.__table__, "columns"):
-            data: dict[str, Any] = {}
-            for column in value.__table__.columns:
-                data[column.name] = self._make_json_safe(getattr(value, column.name))
-            return data
+    def _make_json_safe(self, value: Any) -> Any:
+        """
+        Convert tool output (ORM rows, dates, sets, ...) into plain JSON
+        types. Serialization runs in orjson's C encoder with ``_json_default``
+        covering the non-native types, instead of a Python-level recursive walk.
+        """
+        if isinstance(value, Base):
+            # Most tools return a single ORM row; its serializer already
+            # yields plain JSON types, so skip the encode/decode round trip.
+            return _model_serializer(type(value))(value)
 
-        return str(value)
+        return _json_safe_scalar(value)
 
 
 # ------------------------------------------------------------------
 # Module-level warmup helper (call from FastAPI lifespan)
 # ------------------------------------------------------------------
 
-def warmup_llm() -> None:
+async def warmup_llm() -> None:
     """
     Send a tiny prompt to Ollama so that the model is loaded into
     memory *before* the first real user request arrives.
@@ -859,9 +1521,15 @@ def warmup_llm() -> None:
     logger.info("event=llm_warmup phase=start model=%s", model)
     try:
         start = _time.time()
-        resp = requests.post(url, json=payload, timeout=_DEFAULT_OLLAMA_TIMEOUT)
+        timeout = aiohttp.ClientTimeout(
+            total=_DEFAULT_OLLAMA_TIMEOUT,
+            sock_connect=_DEFAULT_OLLAMA_CONNECT_TIMEOUT,
+        )
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with session.post(url, json=payload) as resp:
+                resp.raise_for_status()
+                await resp.read()
         duration = _time.time() - start
-        resp.raise_for_status()
         logger.info(
             "event=llm_warmup phase=success model=%s latency=%.2fs",
             model,
@@ -1,7 +1,52 @@
+import re
+
 from sqlalchemy.orm import Session
 
 from garage_agent.ai.base_engine import BaseEngine
 
+# Trivial intents answered without a model call. Patterns must match the
+# whole message (ignoring trailing punctuation) so that "hi, book a service
+# tomorrow" still reaches the LLM.
+_FAST_INTENTS: tuple[tuple[str, str, str], ...] = (
+    (
+        "greeting",
+        r"(?:hi+|hello|hey|good\s+(?:morning|afternoon|evening))[\s!.]*",
+        "Hello! How can I help with your vehicle today?",
+    ),
+    (
+        "thanks",
+        r"(?:ok(?:ay)?\s+)?(?:thanks|thank\s+you|thx|ty)[\s!.]*",
+        "You're welcome! Let us know if you need anything else.",
+    ),
+    (
+        "goodbye",
+        r"(?:ok(?:ay)?\s+)?(?:bye|goodbye|good\s*bye|see\s+you|cya)[\s!.]*",
+        "Goodbye! Drive safe, and message us anytime you need service.",
+    ),
+    (
+        "help",
+        r"(?:help|menu)[\s!?.]*",
+        "I can book, reschedule or cancel a service appointment and check on your vehicle. "
+        "Just tell me what you need.",
+    ),
+)
+
+# All intents compiled into one alternation so a message is scanned once;
+# the matching named group identifies the intent.
+_FAST_INTENT_PATTERN = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in _FAST_INTENTS),
+    re.IGNORECASE,
+)
+_FAST_INTENT_REPLIES: dict[str, str] = {name: reply for name, _, reply in _FAST_INTENTS}
+
+
+def match_fast_intent(message: str) -> str | None:
+    """Return the canned reply for a trivial message, or None."""
+    match = _FAST_INTENT_PATTERN.fullmatch(message)
+    if match is None:
+        return None
+    return _FAST_INTENT_REPLIES[match.lastgroup]
+
 
 class RuleEngine(BaseEngine):
     """
@@ -9,15 +54,17 @@ class RuleEngine(BaseEngine):
     Future LLM engine will implement same interface.
     """
 
-    def process(self, db: Session, garage_id: int, phone: str, message: str) -> dict:
+    __slots__ = ()
+
+    async def process(self, db: Session, garage_id: int, phone: str, message: str) -> dict:
         """
         Process incoming message.
-        Currently returns structured metadata only.
+        Answers trivial intents directly; otherwise returns structured metadata only.
         """
         return {
             "engine": "rule",
             "type": "conversation",
-            "reply": "Request processed.",
+            "reply": match_fast_intent((message or "").strip()) or "Request processed.",
             "tool": None,
             "arguments": None,
             "result": None,
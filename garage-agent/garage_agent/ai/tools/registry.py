@@ -5,13 +5,15 @@ Maps tool names to executable functions.
 This allows LLM engine to dynamically call tools.
 """
 
-import copy
 import inspect
 import logging
 import types
 from datetime import date, datetime, time
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Callable, Union, get_args, get_origin
 
+import orjson
 from sqlalchemy.orm import Session
 
 from garage_agent.ai.tools.booking_tools import (
@@ -83,6 +85,14 @@ class ToolRegistry:
             },
         }
 
+        # Result cache TTL (seconds) for tools that only read data. Tools not
+        # listed mutate state and are never cached. Vehicle history moves
+        # slower than the day's booking counts, so it may be kept longer.
+        self._tool_cache_ttls: dict[str, float] = {
+            "get_daily_summary": 30,
+            "analyze_vehicle_health": 300,
+        }
+
         self._tool_descriptions = {
             "create_booking": "Create a new service booking for a customer.",
             "reschedule_booking": "Reschedule an existing booking to a new date and time.",
@@ -122,39 +132,90 @@ class ToolRegistry:
                 "vehicle_id": int,
             },
         }
-        self._openai_tool_definitions = self._build_openai_tool_definitions()
+        # Argument types are fixed per tool, so resolve each annotation to a
+        # specialised converter once instead of re-inspecting it per call.
+        self._tool_coercers: dict[str, dict[str, Callable[[Any], Any]]] = {
+            tool_name: {
+                param_name: _build_coercer(annotation)
+                for param_name, annotation in param_types.items()
+            }
+            for tool_name, param_types in self._tool_param_types.items()
+        }
+
+        # The tool set is fixed after construction; freeze it for lookups.
+        self._tool_names: frozenset[str] = frozenset(self._tools)
+
+        # Tool signatures never change, so inspect them once rather than on
+        # every execute() call.
+        self._tool_required_args: dict[str, frozenset[str]] = {}
+        self._tools_accepting_garage_id: set[str] = set()
+        for tool_name, tool_function in self._tools.items():
+            parameters = inspect.signature(tool_function).parameters
+            self._tool_required_args[tool_name] = frozenset(
+                param_name
+                for param_name, param in parameters.items()
+                if param_name not in {"db", "garage_id"}
+                and param.default is inspect._empty
+            )
+            if "garage_id" in parameters:
+                self._tools_accepting_garage_id.add(tool_name)
+
+        # OpenAI-style definitions are only needed by callers that ask for
+        # them, so they are built on first use instead of at startup.
+        self._openai_tool_definitions_json: bytes | None = None
 
     def list_tools(self):
         return list(self._tools.keys())
 
     def has_tool(self, tool_name: str) -> bool:
-        return tool_name in self._tools
+        return tool_name in self._tool_names
+
+    def is_readonly(self, tool_name: str) -> bool:
+        return tool_name in self._tool_cache_ttls
+
+    def get_cache_ttl(self, tool_name: str) -> float:
+        return self._tool_cache_ttls.get(tool_name, 0)
+
+    def get_openai_tool_definitions_json(self) -> bytes:
+        """Return the tool definitions as byte-stable, pre-serialized JSON."""
+        if self._openai_tool_definitions_json is None:
+            # Sorted keys make the bytes canonical no matter how the schema
+            # dicts were assembled.
+            self._openai_tool_definitions_json = orjson.dumps(
+                self._build_openai_tool_definitions(),
+                option=orjson.OPT_SORT_KEYS,
+            )
+        return self._openai_tool_definitions_json
 
     def get_openai_tool_definitions(self) -> list[dict]:
-        return copy.deepcopy(self._openai_tool_definitions)
+        # Decoding the cached JSON hands each caller its own mutable copy and
+        # is cheaper than deep-copying the nested dicts.
+        return orjson.loads(self.get_openai_tool_definitions_json())
 
     def get_openai_tools(self) -> list[dict]:
         # Backward compatibility for older callers.
         return self.get_openai_tool_definitions()
 
     def sanitize_arguments(self, tool_name: str, arguments: dict[str, Any] | None) -> dict[str, Any]:
-        if not tool_name or not isinstance(arguments, dict):
+        if not tool_name or not isinstance(arguments, dict) or not arguments:
             return {}
 
-        expected_params = self._tool_param_types.get(tool_name, {})
+        coercers = self._tool_coercers.get(tool_name, {})
         sanitized: dict[str, Any] = {}
 
         for key, value in arguments.items():
-            if key not in expected_params:
+            coerce = coercers.get(key)
+            if coerce is None:
                 continue
-            sanitized[key] = self._coerce_value(value=value, annotation=expected_params[key])
+            sanitized[key] = coerce(value)
 
-        dropped_keys = set(arguments.keys()) - set(sanitized.keys())
-        if dropped_keys:
+        # Every kept key comes from arguments, so equal sizes mean nothing
+        # was dropped and the set difference can be skipped.
+        if len(sanitized) != len(arguments):
             logger.warning(
                 "Dropped unsupported arguments for '%s': %s",
                 tool_name,
-                sorted(dropped_keys),
+                sorted(arguments.keys() - sanitized.keys()),
             )
 
         return sanitized
@@ -183,14 +244,7 @@ class ToolRegistry:
             )
             raise ValueError("Tool validation failed")
 
-        signature = inspect.signature(tool_function)
-        required_args = {
-            param_name
-            for param_name, param in signature.parameters.items()
-            if param_name not in {"db", "garage_id"}
-            and param.default is inspect._empty
-        }
-        missing_args = required_args - provided_args
+        missing_args = self._tool_required_args[tool_name] - provided_args
         if missing_args:
             logger.warning(
                 "Tool validation failed for '%s': missing required args=%s",
@@ -199,14 +253,12 @@ class ToolRegistry:
             )
             raise ValueError("Tool validation failed")
 
-        execute_kwargs = {"db": db}
-        if "garage_id" in signature.parameters:
+        # kwargs is already known to be a subset of allowed_args here.
+        execute_kwargs = {"db": db, **kwargs}
+        if tool_name in self._tools_accepting_garage_id:
             execute_kwargs["garage_id"] = garage_id
-        for arg_name in allowed_args:
-            if arg_name in kwargs:
-                execute_kwargs[arg_name] = kwargs[arg_name]
 
-        logger.info("Tool execution started: %s", tool_name)
+        logger.debug("Tool execution started: %s", tool_name)
         success = False
         result: Any = None
         error_message: str | None = None
@@ -218,7 +270,7 @@ class ToolRegistry:
             error_message = str(exc)
             logger.exception("Tool execution failed for '%s'", tool_name)
         finally:
-            logger.info("Tool execution finished: %s success=%s", tool_name, success)
+            logger.debug("Tool execution finished: %s success=%s", tool_name, success)
 
         return {
             "success": success,
@@ -406,81 +458,132 @@ class ToolRegistry:
         return f"Execute tool '{tool_name}'."
 
     def _annotation_to_schema(self, param_name: str, annotation: Any) -> dict:
-        normalized_type = self._normalize_annotation(annotation)
-
-        schema_type = "string"
-        if normalized_type is bool:
-            schema_type = "boolean"
-        elif normalized_type is int:
-            schema_type = "integer"
-        elif normalized_type is float:
-            schema_type = "number"
-
-        schema: dict[str, Any] = {
-            "type": schema_type,
+        # Type-specific keys (including the date/time descriptions) win over
+        # the generic description derived from the parameter name.
+        return {
             "description": param_name.replace("_", " "),
+            **_schema_for_type(_normalize_annotation(annotation)),
         }
 
-        if normalized_type is date:
-            schema["type"] = "string"
-            schema["format"] = "date"
-            schema["description"] = "Date in YYYY-MM-DD format."
-        elif normalized_type is time:
-            schema["type"] = "string"
-            schema["description"] = "Time in HH:MM format."
-        elif normalized_type is datetime:
-            schema["type"] = "string"
-            schema["format"] = "date-time"
+    def _normalize_annotation(self, annotation: Any) -> Any:
+        return _normalize_annotation(annotation)
 
-        return schema
+    def _coerce_value(self, value: Any, annotation: Any) -> Any:
+        return _build_coercer(annotation)(value)
 
-    def _normalize_annotation(self, annotation: Any) -> Any:
-        origin = get_origin(annotation)
-        if origin in (Union, types.UnionType):
-            args = get_args(annotation)
-            non_none_args = [arg for arg in args if arg is not type(None)]
-            if len(non_none_args) == 1:
-                return non_none_args[0]
-            return str
+    def _build_coercer(self, annotation: Any) -> Callable[[Any], Any]:
+        return _build_coercer(annotation)
 
-        if annotation in (inspect._empty, Any):
-            return str
 
-        return annotation
+# Annotations repeat across tools (int ids, optional dates, ...), so the
+# type-derived helpers below are memoised per annotation.
 
-    def _coerce_value(self, value: Any, annotation: Any) -> Any:
-        target_type = self._normalize_annotation(annotation)
-        if value is None:
-            return None
+@lru_cache(maxsize=256)
+def _normalize_annotation(annotation: Any) -> Any:
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        args = get_args(annotation)
+        non_none_args = [arg for arg in args if arg is not type(None)]
+        if len(non_none_args) == 1:
+            return non_none_args[0]
+        return str
+
+    if annotation in (inspect._empty, Any):
+        return str
+
+    return annotation
+
+
+@lru_cache(maxsize=256)
+def _schema_for_type(normalized_type: Any) -> MappingProxyType:
+    schema: dict[str, Any] = {"type": "string"}
+    if normalized_type is bool:
+        schema["type"] = "boolean"
+    elif normalized_type is int:
+        schema["type"] = "integer"
+    elif normalized_type is float:
+        schema["type"] = "number"
+    elif normalized_type is date:
+        schema["format"] = "date"
+        schema["description"] = "Date in YYYY-MM-DD format."
+    elif normalized_type is time:
+        schema["description"] = "Time in HH:MM format."
+    elif normalized_type is datetime:
+        schema["format"] = "date-time"
+
+    return MappingProxyType(schema)
 
-        try:
-            if target_type is bool:
-                if isinstance(value, str):
-                    lowered = value.strip().lower()
-                    if lowered in {"true", "yes", "1"}:
-                        return True
-                    if lowered in {"false", "no", "0"}:
-                        return False
-                return bool(value)
 
-            if target_type is int and not isinstance(value, int):
-                return int(value)
+def _coerce_bool(value: Any) -> Any:
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in {"true", "yes", "1"}:
+            return True
+        if lowered in {"false", "no", "0"}:
+            return False
+    return bool(value)
 
-            if target_type is float and not isinstance(value, float):
-                return float(value)
 
-            if target_type is str and not isinstance(value, str):
-                return str(value)
+def _coerce_int(value: Any) -> Any:
+    return value if isinstance(value, int) else int(value)
 
-            if target_type is date and isinstance(value, str):
-                return date.fromisoformat(value)
 
-            if target_type is time and isinstance(value, str):
-                return time.fromisoformat(value)
+def _coerce_float(value: Any) -> Any:
+    return value if isinstance(value, float) else float(value)
 
-            if target_type is datetime and isinstance(value, str):
-                return datetime.fromisoformat(value)
+
+def _coerce_str(value: Any) -> Any:
+    return value if isinstance(value, str) else str(value)
+
+
+# The model tends to repeat the same few dates and times across calls.
+# Results are immutable, and lru_cache does not store raised ValueErrors, so
+# malformed strings never enter the cache.
+_parse_date = lru_cache(maxsize=1024)(date.fromisoformat)
+_parse_time = lru_cache(maxsize=1024)(time.fromisoformat)
+_parse_datetime = lru_cache(maxsize=1024)(datetime.fromisoformat)
+
+
+def _coerce_date(value: Any) -> Any:
+    return _parse_date(value) if isinstance(value, str) else value
+
+
+def _coerce_time(value: Any) -> Any:
+    return _parse_time(value) if isinstance(value, str) else value
+
+
+def _coerce_datetime(value: Any) -> Any:
+    return _parse_datetime(value) if isinstance(value, str) else value
+
+
+def _coerce_passthrough(value: Any) -> Any:
+    return value
+
+
+# Jump table from normalised annotation to its converter.
+_COERCERS: dict[Any, Callable[[Any], Any]] = {
+    bool: _coerce_bool,
+    int: _coerce_int,
+    float: _coerce_float,
+    str: _coerce_str,
+    date: _coerce_date,
+    time: _coerce_time,
+    datetime: _coerce_datetime,
+}
+
+
+@lru_cache(maxsize=256)
+def _build_coercer(annotation: Any) -> Callable[[Any], Any]:
+    target_type = _normalize_annotation(annotation)
+    convert = _COERCERS.get(target_type, _coerce_passthrough)
+
+    def coerce(value: Any) -> Any:
+        if value is None:
+            return None
+        try:
+            return convert(value)
         except (TypeError, ValueError):
             logger.warning("Failed to coerce value '%s' to %s", value, target_type)
-
         return value
+
+    return coerce
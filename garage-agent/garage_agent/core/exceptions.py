@@ -1,33 +1,33 @@
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import HTTPException
 
-from garage_agent.schemas.common import APIResponse, APIError
 from garage_agent.core.error_codes import ErrorCode
 
 from garage_agent.core.domain_exceptions import DomainException
 
 
+# Same shape as APIResponse(success=False, error=APIError(...)).model_dump(),
+# built as a plain dict so error paths skip pydantic validation.
+def _error_content(code: str, message: str) -> dict:
+    return {
+        "success": False,
+        "data": None,
+        "error": {
+            "code": code,
+            "message": message,
+        },
+    }
+
+
 async def http_exception_handler(request: Request, exc: HTTPException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content=APIResponse(
-            success=False,
-            error=APIError(
-                code=ErrorCode.VALIDATION_ERROR,
-                message=str(exc.detail),
-            ),
-        ).model_dump(),
+        content=_error_content(ErrorCode.VALIDATION_ERROR, str(exc.detail)),
     )
 
 async def domain_exception_handler(request: Request, exc: DomainException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
-        content=APIResponse(
-            success=False,
-            error=APIError(
-                code=exc.code,
-                message=exc.message,
-            ),
-        ).model_dump(),
-    )    
\ No newline at end of file
+        content=_error_content(exc.code, exc.message),
+    )
@@ -1,5 +1,5 @@
 import logging
-import uuid
+import os
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
@@ -8,7 +8,7 @@ logger = logging.getLogger(__name__)
 
 class RequestContextMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next) -> Response:
-        request_id = str(uuid.uuid4())
+        request_id = os.urandom(16).hex()
         request.state.request_id = request_id
         
         response = await call_next(request)
@@ -1,9 +1,10 @@
 """Bootstrap helpers for garage tenancy defaults."""
 
 import os
+import time as _time
 from dataclasses import dataclass
 
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.orm import Session
 
 from garage_agent.db.models import Customer, Garage
@@ -13,6 +14,17 @@ DEFAULT_GARAGE_WHATSAPP_NUMBER = os.getenv(
     "DEFAULT_GARAGE_WHATSAPP_NUMBER",
     "whatsapp:+10000000000",
 )
+DEFAULT_GARAGE_CACHE_TTL = 300  # seconds
+PHONE_GARAGE_CACHE_TTL = 300  # seconds
+PHONE_GARAGE_CACHE_MAX_ENTRIES = 4096
+
+# (garage_id, cached_at) of the default garage; see resolve_default_garage_context.
+_default_garage_id_cache: tuple[int, float] | None = None
+
+# normalized phone -> (garage_id, cached_at) for known customers; see
+# resolve_garage_from_phone. Unknown phones are not cached so a newly created
+# customer is picked up on their next message.
+_phone_garage_cache: dict[str, tuple[int, float]] = {}
 
 
 @dataclass(frozen=True)
@@ -22,9 +34,18 @@ class GarageContext:
 
 def _build_unique_default_whatsapp_number(db: Session) -> str:
     base_number = DEFAULT_GARAGE_WHATSAPP_NUMBER
+    # Fetch the base number and all of its "-N" variants in one query, then
+    # pick the first free suffix locally.
+    taken = set(
+        db.scalars(
+            select(Garage.whatsapp_number).where(
+                Garage.whatsapp_number.startswith(base_number, autoescape=True)
+            )
+        )
+    )
     candidate = base_number
     suffix = 1
-    while db.scalar(select(Garage.id).where(Garage.whatsapp_number == candidate)) is not None:
+    while candidate in taken:
         suffix += 1
         candidate = f"{base_number}-{suffix}"
     return candidate
@@ -51,19 +72,58 @@ def get_default_garage(db: Session) -> Garage:
 
 
 def resolve_default_garage_context(db: Session) -> GarageContext:
+    """Resolve the default garage, reusing the cached id for DEFAULT_GARAGE_CACHE_TTL."""
+    global _default_garage_id_cache
+
+    now = _time.monotonic()
+    if _default_garage_id_cache is not None:
+        garage_id, cached_at = _default_garage_id_cache
+        if now - cached_at < DEFAULT_GARAGE_CACHE_TTL:
+            return GarageContext(garage_id=garage_id)
+
     garage = get_default_garage(db)
+    _default_garage_id_cache = (garage.id, now)
     return GarageContext(garage_id=garage.id)
 
 
+def _normalize_phone(phone: str | None) -> str:
+    return (phone or "").removeprefix("whatsapp:").strip()
+
+
+def invalidate_phone_cache(db: Session, phone: str | None) -> None:
+    """Drop the cached garage for a phone once db commits, e.g. after creating a customer with it."""
+    # Dropping it now would let a concurrent lookup re-cache the pre-commit
+    # garage, so wait until the new row is visible to other sessions.
+    db.info.setdefault("invalidated_phones", set()).add(_normalize_phone(phone))
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_committed_phones(session: Session) -> None:
+    for normalized_phone in session.info.pop("invalidated_phones", ()):
+        _phone_garage_cache.pop(normalized_phone, None)
+
+
 def resolve_garage_from_phone(db: Session, phone: str | None) -> GarageContext:
-    normalized_phone = (phone or "").replace("whatsapp:", "").strip()
+    normalized_phone = _normalize_phone(phone)
     if normalized_phone:
+        now = _time.monotonic()
+        cached = _phone_garage_cache.get(normalized_phone)
+        if cached is not None and now - cached[1] < PHONE_GARAGE_CACHE_TTL:
+            return GarageContext(garage_id=cached[0])
+
         garage_id = db.scalar(
             select(Customer.garage_id)
             .where(Customer.phone == normalized_phone)
             .order_by(Customer.id.desc())
         )
         if garage_id is not None:
+            if (
+                normalized_phone not in _phone_garage_cache
+                and len(_phone_garage_cache) >= PHONE_GARAGE_CACHE_MAX_ENTRIES
+            ):
+                # Evict the oldest insertion; dicts preserve insertion order.
+                _phone_garage_cache.pop(next(iter(_phone_garage_cache)), None)
+            _phone_garage_cache[normalized_phone] = (int(garage_id), now)
             return GarageContext(garage_id=int(garage_id))
 
     return resolve_default_garage_context(db)
@@ -1,290 +1,421 @@
 """Database initialization utilities."""
 
 import logging
+import os
+from dataclasses import dataclass, field
 
 from sqlalchemy import inspect, text
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.engine import Connection, Inspector
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from garage_agent.db import models  # noqa: F401 - ensure model metadata is registered
+from garage_agent.db.models import BookingStatus
 from garage_agent.db.session import Base, engine
 
 logger = logging.getLogger(__name__)
 
+# Set AUTO_MIGRATE_DB=0 on workers that start against an already-migrated
+# database (e.g. extra replicas after a deploy step ran init_db once) to skip
+# schema reflection and the additive migrations on boot.
+AUTO_MIGRATE_DB = os.getenv("AUTO_MIGRATE_DB", "1") != "0"
 
-def _table_exists(table_name: str) -> bool:
-    inspector = inspect(engine)
-    return table_name in inspector.get_table_names()
+# Stamped into PRAGMA user_version once the migrations below have run. New
+# tables are created on every boot regardless, but any change to an existing
+# table (a model column or index, or a new step in _migrate_schema) needs a
+# bump so existing databases migrate again.
+SCHEMA_VERSION = 1
 
+_initialized = False
 
-def _get_columns(table_name: str) -> set[str]:
-    if not _table_exists(table_name):
-        return set()
-    inspector = inspect(engine)
-    return {column["name"] for column in inspector.get_columns(table_name)}
 
+@dataclass
+class _SchemaCache:
+    """Reflected schema shared by the migration helpers during one init_db run."""
+
+    inspector: Inspector
+    tables: set[str]
+    columns: dict[str, set[str]] = field(default_factory=dict)
+
+
+_schema: _SchemaCache | None = None
+
+
+def _schema_cache(connection: Connection) -> _SchemaCache:
+    global _schema
+
+    if _schema is None:
+        inspector = inspect(connection)
+        _schema = _SchemaCache(inspector=inspector, tables=set(inspector.get_table_names()))
+    return _schema
 
-def _ensure_column(table_name: str, column_name: str, column_ddl: str) -> None:
-    existing_columns = _get_columns(table_name)
-    if column_name in existing_columns:
-        return
 
-    with engine.begin() as connection:
-        connection.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_ddl}"))
+def _table_exists(connection: Connection, table_name: str) -> bool:
+    return table_name in _schema_cache(connection).tables
 
 
-def _ensure_index(table_name: str, index_name: str, columns: list[str]) -> None:
-    if not _table_exists(table_name):
+def _get_columns(connection: Connection, table_name: str) -> set[str]:
+    schema = _schema_cache(connection)
+    if table_name not in schema.tables:
+        return set()
+    columns = schema.columns.get(table_name)
+    if columns is None:
+        columns = {column["name"] for column in schema.inspector.get_columns(table_name)}
+        schema.columns[table_name] = columns
+    return columns
+
+
+def _ensure_column(
+    connection: Connection,
+    table_name: str,
+    column_name: str,
+    column_ddl: str,
+) -> None:
+    existing_columns = _get_columns(connection, table_name)
+    if column_name in existing_columns:
         return
 
-    columns_sql = ", ".join(columns)
-    with engine.begin() as connection:
-        connection.execute(
-            text(
-                f"CREATE INDEX IF NOT EXISTS {index_name} "
-                f"ON {table_name} ({columns_sql})"
-            )
-        )
+    connection.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_ddl}"))
+    # Keep the cached column set in step instead of reflecting again.
+    existing_columns.add(column_name)
 
 
-def _has_duplicate_rows(
+def _ensure_index(
+    connection: Connection,
     table_name: str,
+    index_name: str,
     columns: list[str],
-    where_clause: str | None = None,
-) -> bool:
-    if not _table_exists(table_name):
-        return False
+) -> None:
+    if not _table_exists(connection, table_name):
+        return
 
     columns_sql = ", ".join(columns)
-    where_sql = f" WHERE {where_clause}" if where_clause else ""
-    duplicate_query = (
-        f"SELECT 1 FROM {table_name}"
-        f"{where_sql} "
-        f"GROUP BY {columns_sql} "
-        "HAVING COUNT(*) > 1 "
-        "LIMIT 1"
+    connection.execute(
+        text(
+            f"CREATE INDEX IF NOT EXISTS {index_name} "
+            f"ON {table_name} ({columns_sql})"
+        )
     )
-    with engine.connect() as connection:
-        return connection.execute(text(duplicate_query)).first() is not None
 
 
 def _ensure_unique_index_if_clean(
+    connection: Connection,
     table_name: str,
     index_name: str,
     columns: list[str],
     where_clause: str | None = None,
-) -> None:
-    if _has_duplicate_rows(table_name=table_name, columns=columns, where_clause=where_clause):
+) -> bool:
+    """Create the unique index unless existing rows violate it; return whether it exists."""
+    if not _table_exists(connection, table_name):
+        return True
+
+    columns_sql = ", ".join(columns)
+    where_sql = f" WHERE {where_clause}" if where_clause else ""
+    # Let the index build itself detect duplicates instead of scanning the
+    # table first; the savepoint keeps a failed build from aborting the
+    # surrounding migration transaction.
+    try:
+        with connection.begin_nested():
+            connection.execute(
+                text(
+                    f"CREATE UNIQUE INDEX IF NOT EXISTS {index_name} "
+                    f"ON {table_name} ({columns_sql}){where_sql}"
+                )
+            )
+    except IntegrityError:
         logger.warning(
             "Skipping unique index %s on %s due to duplicate existing data.",
             index_name,
             table_name,
         )
-        return
+        return False
+    return True
+
 
-    if not _table_exists(table_name):
+def _backfill_null_column(
+    connection: Connection,
+    table_name: str,
+    column_name: str,
+    value: int,
+) -> None:
+    if column_name not in _get_columns(connection, table_name):
         return
 
-    columns_sql = ", ".join(columns)
-    where_sql = f" WHERE {where_clause}" if where_clause else ""
-    with engine.begin() as connection:
-        connection.execute(
-            text(
-                f"CREATE UNIQUE INDEX IF NOT EXISTS {index_name} "
-                f"ON {table_name} ({columns_sql}){where_sql}"
-            )
-        )
+    connection.execute(
+        text(
+            f"UPDATE {table_name} "
+            f"SET {column_name} = :value "
+            f"WHERE {column_name} IS NULL"
+        ),
+        {"value": value},
+    )
 
 
-def _backfill_null_column(table_name: str, column_name: str, value: int) -> None:
-    if column_name not in _get_columns(table_name):
+def _migrate_booking_status_codes(connection: Connection) -> None:
+    """Rewrite legacy status names in bookings to their SMALLINT codes."""
+    if "status" not in _get_columns(connection, "bookings"):
         return
 
-    with engine.begin() as connection:
-        connection.execute(
-            text(
-                f"UPDATE {table_name} "
-                f"SET {column_name} = :value "
-                f"WHERE {column_name} IS NULL"
-            ),
-            {"value": value},
+    cases = " ".join(
+        f"WHEN '{status.name}' THEN {status.value}" for status in BookingStatus
+    )
+    names = ", ".join(f"'{status.name}'" for status in BookingStatus)
+    connection.execute(
+        text(
+            f"UPDATE bookings SET status = CASE status {cases} END "
+            f"WHERE status IN ({names})"
         )
+    )
 
 
-def _ensure_default_garage() -> int:
-    if not _table_exists("garages"):
+def _ensure_default_garage(connection: Connection) -> int:
+    if not _table_exists(connection, "garages"):
         raise RuntimeError("garages table is missing after metadata creation.")
 
-    with engine.begin() as connection:
+    values = {"name": "Default Garage", "phone": None}
+    if "whatsapp_number" in _get_columns(connection, "garages"):
+        values["whatsapp_number"] = "whatsapp:+10000000000"
+
+    # Insert only into an empty table and read the new id back in the same
+    # statement; an existing first garage is looked up only when nothing was
+    # inserted.
+    columns_sql = ", ".join(values)
+    params_sql = ", ".join(f":{column}" for column in values)
+    garage_id = connection.execute(
+        text(
+            f"INSERT INTO garages ({columns_sql}) "
+            f"SELECT {params_sql} "
+            "WHERE NOT EXISTS (SELECT 1 FROM garages) "
+            "RETURNING id"
+        ),
+        values,
+    ).scalar()
+
+    if garage_id is None:
         garage_id = connection.execute(
             text("SELECT id FROM garages ORDER BY id ASC LIMIT 1")
-        ).scalar()
-
-        if garage_id is not None:
-            return int(garage_id)
-
-        columns = _get_columns("garages")
-        if "whatsapp_number" in columns:
-            connection.execute(
-                text(
-                    "INSERT INTO garages (name, phone, whatsapp_number) "
-                    "VALUES (:name, :phone, :whatsapp_number)"
-                ),
-                {
-                    "name": "Default Garage",
-                    "phone": None,
-                    "whatsapp_number": "whatsapp:+10000000000",
-                },
-            )
-        else:
-            connection.execute(
-                text("INSERT INTO garages (name, phone) VALUES (:name, :phone)"),
-                {"name": "Default Garage", "phone": None},
-            )
-
-        created_id = connection.execute(
-            text("SELECT id FROM garages ORDER BY id ASC LIMIT 1")
         ).scalar_one()
 
-    return int(created_id)
+    return int(garage_id)
 
 
-def _backfill_garage_whatsapp_numbers() -> None:
-    if "whatsapp_number" not in _get_columns("garages"):
+def _backfill_garage_whatsapp_numbers(connection: Connection) -> None:
+    if "whatsapp_number" not in _get_columns(connection, "garages"):
         return
 
-    with engine.begin() as connection:
-        connection.execute(
-            text(
-                "UPDATE garages "
-                "SET whatsapp_number = 'whatsapp:+10000000000-' || id "
-                "WHERE whatsapp_number IS NULL OR TRIM(whatsapp_number) = ''"
-            )
+    connection.execute(
+        text(
+            "UPDATE garages "
+            "SET whatsapp_number = 'whatsapp:+10000000000-' || id "
+            "WHERE whatsapp_number IS NULL OR TRIM(whatsapp_number) = ''"
         )
+    )
 
 
-def init_db() -> None:
-    """Create and migrate schema in a SQLite-safe, additive manner."""
-    try:
-        Base.metadata.create_all(bind=engine)
+def _migrate_schema(connection: Connection) -> bool:
+    """Run the additive migrations; return False if any step must be retried later."""
+    complete = True
 
+    _ensure_column(
+        connection,
+        table_name="customers",
+        column_name="health_score",
+        column_ddl="health_score INTEGER NOT NULL DEFAULT 0",
+    )
+    _ensure_column(
+        connection,
+        table_name="vehicles",
+        column_name="next_service_due_date",
+        column_ddl="next_service_due_date DATE",
+    )
+    _ensure_column(
+        connection,
+        table_name="vehicles",
+        column_name="next_service_date",
+        column_ddl="next_service_date DATE",
+    )
+    _ensure_column(
+        connection,
+        table_name="vehicles",
+        column_name="next_service_mileage",
+        column_ddl="next_service_mileage INTEGER",
+    )
+    _ensure_column(
+        connection,
+        table_name="vehicles",
+        column_name="last_reminder_sent_at",
+        column_ddl="last_reminder_sent_at DATETIME",
+    )
+    _ensure_column(
+        connection,
+        table_name="garages",
+        column_name="whatsapp_number",
+        column_ddl="whatsapp_number VARCHAR(32)",
+    )
+
+    default_garage_id = _ensure_default_garage(connection)
+
+    for table_name in ("customers", "vehicles", "bookings", "job_cards"):
         _ensure_column(
-            table_name="customers",
-            column_name="health_score",
-            column_ddl="health_score INTEGER NOT NULL DEFAULT 0",
-        )
-        _ensure_column(
-            table_name="vehicles",
-            column_name="next_service_due_date",
-            column_ddl="next_service_due_date DATE",
-        )
-        _ensure_column(
-            table_name="vehicles",
-            column_name="next_service_date",
-            column_ddl="next_service_date DATE",
-        )
-        _ensure_column(
-            table_name="vehicles",
-            column_name="next_service_mileage",
-            column_ddl="next_service_mileage INTEGER",
+            connection,
+            table_name=table_name,
+            column_name="garage_id",
+            column_ddl=f"garage_id INTEGER NOT NULL DEFAULT {default_garage_id}",
         )
-        _ensure_column(
-            table_name="vehicles",
-            column_name="last_reminder_sent_at",
-            column_ddl="last_reminder_sent_at DATETIME",
+        _backfill_null_column(
+            connection,
+            table_name=table_name,
+            column_name="garage_id",
+            value=default_garage_id,
         )
-        _ensure_column(
-            table_name="garages",
-            column_name="whatsapp_number",
-            column_ddl="whatsapp_number VARCHAR(32)",
+        _ensure_index(
+            connection,
+            table_name=table_name,
+            index_name=f"ix_{table_name}_garage_id",
+            columns=["garage_id"],
         )
 
-        default_garage_id = _ensure_default_garage()
+    _ensure_index(
+        connection,
+        table_name="bookings",
+        index_name="ix_bookings_reminder_scan",
+        columns=["garage_id", "service_date", "reminder_sent"],
+    )
+    _ensure_index(
+        connection,
+        table_name="bookings",
+        index_name="ix_bookings_vehicle_date",
+        columns=["vehicle_id", "service_date"],
+    )
+    _ensure_index(
+        connection,
+        table_name="vehicles",
+        index_name="ix_vehicles_customer_garage",
+        columns=["customer_id", "garage_id"],
+    )
 
-        for table_name in ("customers", "vehicles", "bookings", "job_cards"):
-            _ensure_column(
-                table_name=table_name,
-                column_name="garage_id",
-                column_ddl=f"garage_id INTEGER NOT NULL DEFAULT {default_garage_id}",
-            )
-            _backfill_null_column(
-                table_name=table_name,
-                column_name="garage_id",
-                value=default_garage_id,
-            )
-            _ensure_index(
-                table_name=table_name,
-                index_name=f"ix_{table_name}_garage_id",
-                columns=["garage_id"],
-            )
+    _backfill_garage_whatsapp_numbers(connection)
+    _migrate_booking_status_codes(connection)
 
-        _backfill_garage_whatsapp_numbers()
+    _ensure_column(
+        connection,
+        table_name="reminders",
+        column_name="responded_at",
+        column_ddl="responded_at DATETIME",
+    )
+    _ensure_column(
+        connection,
+        table_name="reminders",
+        column_name="booking_id",
+        column_ddl="booking_id INTEGER REFERENCES bookings(id)",
+    )
 
-        _ensure_column(
-            table_name="reminders",
-            column_name="responded_at",
-            column_ddl="responded_at DATETIME",
-        )
-        _ensure_column(
-            table_name="reminders",
-            column_name="booking_id",
-            column_ddl="booking_id INTEGER REFERENCES bookings(id)",
-        )
+    complete &= _ensure_unique_index_if_clean(
+        connection,
+        table_name="garages",
+        index_name="uq_garages_whatsapp_number",
+        columns=["whatsapp_number"],
+        where_clause="whatsapp_number IS NOT NULL AND TRIM(whatsapp_number) <> ''",
+    )
+    complete &= _ensure_unique_index_if_clean(
+        connection,
+        table_name="customers",
+        index_name="uq_customers_garage_phone",
+        columns=["garage_id", "phone"],
+        where_clause="phone IS NOT NULL AND TRIM(phone) <> ''",
+    )
 
-        _ensure_unique_index_if_clean(
-            table_name="garages",
-            index_name="uq_garages_whatsapp_number",
-            columns=["whatsapp_number"],
-            where_clause="whatsapp_number IS NOT NULL AND TRIM(whatsapp_number) <> ''",
-        )
-        _ensure_unique_index_if_clean(
-            table_name="customers",
-            index_name="uq_customers_garage_phone",
-            columns=["garage_id", "phone"],
-            where_clause="phone IS NOT NULL AND TRIM(phone) <> ''",
-        )
+    # Users table migration (Phase 9.1)
+    _ensure_column(
+        connection,
+        table_name="users",
+        column_name="garage_id",
+        column_ddl="garage_id INTEGER NOT NULL DEFAULT 1 REFERENCES garages(id)",
+    )
+    _ensure_column(
+        connection,
+        table_name="users",
+        column_name="email",
+        column_ddl="email VARCHAR(255) NOT NULL DEFAULT ''",
+    )
+    _ensure_column(
+        connection,
+        table_name="users",
+        column_name="hashed_password",
+        column_ddl="hashed_password VARCHAR(255) NOT NULL DEFAULT ''",
+    )
+    _ensure_column(
+        connection,
+        table_name="users",
+        column_name="role",
+        column_ddl="role VARCHAR(32) NOT NULL DEFAULT 'OWNER'",
+    )
+    _ensure_column(
+        connection,
+        table_name="users",
+        column_name="is_active",
+        column_ddl="is_active BOOLEAN NOT NULL DEFAULT 1",
+    )
+    _ensure_column(
+        connection,
+        table_name="users",
+        column_name="created_at",
+        column_ddl="created_at DATETIME",
+    )
+    _ensure_index(
+        connection,
+        table_name="users",
+        index_name="ix_users_garage_id",
+        columns=["garage_id"],
+    )
+    complete &= _ensure_unique_index_if_clean(
+        connection,
+        table_name="users",
+        index_name="uq_users_email",
+        columns=["email"],
+        where_clause="email IS NOT NULL AND TRIM(email) <> ''",
+    )
 
-        # Users table migration (Phase 9.1)
-        _ensure_column(
-            table_name="users",
-            column_name="garage_id",
-            column_ddl="garage_id INTEGER NOT NULL DEFAULT 1 REFERENCES garages(id)",
-        )
-        _ensure_column(
-            table_name="users",
-            column_name="email",
-            column_ddl="email VARCHAR(255) NOT NULL DEFAULT ''",
-        )
-        _ensure_column(
-            table_name="users",
-            column_name="hashed_password",
-            column_ddl="hashed_password VARCHAR(255) NOT NULL DEFAULT ''",
-        )
-        _ensure_column(
-            table_name="users",
-            column_name="role",
-            column_ddl="role VARCHAR(32) NOT NULL DEFAULT 'OWNER'",
-        )
-        _ensure_column(
-            table_name="users",
-            column_name="is_active",
-            column_ddl="is_active BOOLEAN NOT NULL DEFAULT 1",
-        )
-        _ensure_column(
-            table_name="users",
-            column_name="created_at",
-            column_ddl="created_at DATETIME",
-        )
-        _ensure_index(
-            table_name="users",
-            index_name="ix_users_garage_id",
-            columns=["garage_id"],
-        )
-        _ensure_unique_index_if_clean(
-            table_name="users",
-            index_name="uq_users_email",
-            columns=["email"],
-            where_clause="email IS NOT NULL AND TRIM(email) <> ''",
-        )
+    return complete
+
+
+def init_db() -> None:
+    """Create and migrate schema in a SQLite-safe, additive manner."""
+    global _initialized, _schema
+
+    if _initialized:
+        return
+    if not AUTO_MIGRATE_DB:
+        logger.info("event=init_db phase=skipped reason=AUTO_MIGRATE_DB=0")
+        _initialized = True
+        return
+
+    try:
+        # One transaction for the whole migration: the helpers share this
+        # connection (and a schema reflected once through it) instead of
+        # committing each step separately.
+        with engine.begin() as connection:
+            # create_all only checks for and adds missing tables, so new
+            # models reach existing databases even when the version matches.
+            Base.metadata.create_all(bind=connection)
+
+            version = connection.exec_driver_sql("PRAGMA user_version").scalar()
+            if version == SCHEMA_VERSION:
+                logger.info(
+                    "event=init_db phase=skipped reason=schema_current version=%s",
+                    version,
+                )
+            elif _migrate_schema(connection):
+                connection.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            else:
+                # Leave the version unstamped so the skipped unique indexes
+                # are retried on the next boot, once duplicates are cleaned up.
+                logger.warning(
+                    "event=init_db phase=incomplete reason=unique_index_skipped version=%s",
+                    version,
+                )
+        _initialized = True
     except SQLAlchemyError:
         logger.exception("Database initialization failed.")
         raise
+    finally:
+        _schema = None
@@ -1,7 +1,8 @@
 """SQLAlchemy ORM models."""
 
+import enum
 from datetime import date, datetime, time
-from typing import Optional
+from typing import Any, Optional
 
 from sqlalchemy import (
     Boolean,
@@ -10,10 +11,13 @@ from sqlalchemy import (
     Float,
     ForeignKey,
     ForeignKeyConstraint,
+    Index,
     Integer,
+    SmallInteger,
     String,
     Text,
     Time,
+    TypeDecorator,
     UniqueConstraint,
     func,
     text,
@@ -23,6 +27,45 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from garage_agent.db.session import Base
 
 
+class BookingStatus(enum.IntEnum):
+    """Storage codes for the fixed booking status vocabulary."""
+
+    PENDING = 0
+    CONFIRMED = 1
+    IN_PROGRESS = 2
+    COMPLETED = 3
+    CANCELLED = 4
+
+
+class BookingStatusType(TypeDecorator):
+    """
+    Store booking status names as SMALLINT codes.
+
+    Application code keeps using the status strings ("PENDING", ...); only
+    the column storage is compact. Values that are not part of the
+    vocabulary are passed through unchanged.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect) -> Any:
+        if isinstance(value, str) and value in BookingStatus.__members__:
+            return BookingStatus[value].value
+        return value
+
+    def process_result_value(self, value: Any, dialect) -> Any:
+        # Migrated SQLite tables keep TEXT affinity, so codes may come back as "0".
+        if isinstance(value, str) and value.isdigit():
+            value = int(value)
+        if isinstance(value, int):
+            try:
+                return BookingStatus(value).name
+            except ValueError:
+                return value
+        return value
+
+
 class Garage(Base):
     """Represents a tenant garage."""
 
@@ -155,6 +198,8 @@ class Vehicle(Base):
             name="fk_vehicles_customer_garage",
         ),
         UniqueConstraint("id", "garage_id", name="uq_vehicles_id_garage"),
+        # A customer's vehicles within a garage (health scoring, booking lookups).
+        Index("ix_vehicles_customer_garage", "customer_id", "garage_id"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
@@ -186,9 +231,11 @@ class Vehicle(Base):
         server_default=func.now(),
     )
 
+    # Joined eagerly: reminder jobs read vehicle.customer for every due vehicle.
     customer: Mapped["Customer"] = relationship(
         back_populates="vehicles",
         overlaps="garage,vehicles",
+        lazy="joined",
     )
     garage: Mapped["Garage"] = relationship(
         back_populates="vehicles",
@@ -213,6 +260,10 @@ class Booking(Base):
             name="fk_bookings_vehicle_garage",
         ),
         UniqueConstraint("id", "garage_id", name="uq_bookings_id_garage"),
+        # Daily reminder scan: garage + today's date + not yet reminded.
+        Index("ix_bookings_reminder_scan", "garage_id", "service_date", "reminder_sent"),
+        # Per-vehicle history ordered by date (last completed service lookups).
+        Index("ix_bookings_vehicle_date", "vehicle_id", "service_date"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
@@ -233,10 +284,10 @@ class Booking(Base):
     service_time: Mapped[time] = mapped_column(Time, nullable=False)
 
     status: Mapped[str] = mapped_column(
-        String(32),
+        BookingStatusType(),
         nullable=False,
         default="PENDING",
-        server_default=text("'PENDING'"),
+        server_default=text(str(BookingStatus.PENDING.value)),
     )
 
     created_at: Mapped[datetime] = mapped_column(
@@ -272,9 +323,11 @@ class Booking(Base):
         nullable=True,
     )
 
+    # Joined eagerly: status transitions always read booking.vehicle.customer_id.
     vehicle: Mapped["Vehicle"] = relationship(
         back_populates="bookings",
         overlaps="garage,bookings",
+        lazy="joined",
     )
     garage: Mapped["Garage"] = relationship(
         back_populates="bookings",
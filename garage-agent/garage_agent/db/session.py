@@ -1,26 +1,88 @@
 """Database engine/session setup for SQLAlchemy."""
 
+from collections import Counter
 from collections.abc import Generator
+from itertools import chain
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 # SQLite database file in the project root.
 DATABASE_URL = "sqlite:///./garage.db"
 
+# Connection pool sizing. Webhook handlers, background AI tasks and the
+# reminder scheduler all check out connections concurrently, so keep enough
+# warm connections around that a burst does not block on checkout.
+DB_POOL_SIZE = 20
+DB_MAX_OVERFLOW = 10
+DB_POOL_RECYCLE_SECONDS = 3600
+
+# Per-connection SQLite settings: WAL lets readers proceed while a writer
+# commits, NORMAL sync is durable across application crashes in WAL mode
+# with far fewer fsyncs, and busy_timeout makes writers wait for the lock
+# instead of failing with "database is locked".
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+)
+
 # Engine is shared across requests; check_same_thread is required for SQLite with FastAPI.
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
     pool_pre_ping=True,
+    pool_recycle=DB_POOL_RECYCLE_SECONDS,
 )
 
+
+@event.listens_for(engine, "connect")
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 # Session factory used by request-scoped dependencies.
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=Session)
 
 # Declarative base class for ORM models.
 Base = declarative_base()
 
+# Number of committed transactions that changed rows of each table, kept per
+# process. In-process caches of query results fold the counts of the tables
+# they read into their keys, so any commit through an ORM session (routes,
+# services, scheduler) retires entries built from older data.
+table_write_counts: Counter[str] = Counter()
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_tables(session: Session, flush_context) -> None:
+    # new/dirty/deleted still hold the pre-flush state at this point.
+    changed_tables = session.info.setdefault("changed_tables", set())
+    for instance in chain(session.new, session.dirty, session.deleted):
+        changed_tables.add(instance.__table__.name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_bulk_write_tables(orm_execute_state) -> None:
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        changed_tables = orm_execute_state.session.info.setdefault("changed_tables", set())
+        changed_tables.add(orm_execute_state.statement.table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _count_committed_tables(session: Session) -> None:
+    for table_name in session.info.pop("changed_tables", ()):
+        table_write_counts[table_name] += 1
+
 
 def get_db() -> Generator[Session, None, None]:
     """Provide a DB session per request and ensure it is closed."""
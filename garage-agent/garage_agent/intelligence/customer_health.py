@@ -1,6 +1,6 @@
 """Deterministic customer health scoring."""
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, case, func, select, update
 from sqlalchemy.orm import Session
 
 from garage_agent.db.models import Booking, Customer, JobCard, Vehicle
@@ -12,32 +12,14 @@ COMPLETED_JOBCARD_SCORE = 5
 
 def update_customer_health(db: Session, garage_id: int, customer_id: int) -> None:
     """Recompute and persist customer health score from current booking/job history."""
-    customer = db.scalar(
-        select(Customer)
-        .where(Customer.id == customer_id)
-        .where(Customer.garage_id == garage_id)
-    )
-    if customer is None:
-        raise ValueError("Customer not found.")
-
-    completed_bookings = db.scalar(
-        select(func.count(Booking.id))
-        .select_from(Booking)
-        .join(
-            Vehicle,
-            and_(
-                Booking.vehicle_id == Vehicle.id,
-                Booking.garage_id == Vehicle.garage_id,
-            ),
+    # One pass over the customer's bookings (and their job card, at most one
+    # per booking) instead of a COUNT query per metric.
+    completed_bookings, cancelled_bookings, completed_job_cards = db.execute(
+        select(
+            func.count(case((Booking.status == "COMPLETED", Booking.id))),
+            func.count(case((Booking.status == "CANCELLED", Booking.id))),
+            func.count(case((JobCard.status == "COMPLETED", JobCard.id))),
         )
-        .where(Booking.garage_id == garage_id)
-        .where(Vehicle.garage_id == garage_id)
-        .where(Vehicle.customer_id == customer_id)
-        .where(Booking.status == "COMPLETED")
-    ) or 0
-
-    cancelled_bookings = db.scalar(
-        select(func.count(Booking.id))
         .select_from(Booking)
         .join(
             Vehicle,
@@ -46,38 +28,31 @@ def update_customer_health(db: Session, garage_id: int, customer_id: int) -> Non
                 Booking.garage_id == Vehicle.garage_id,
             ),
         )
-        .where(Booking.garage_id == garage_id)
-        .where(Vehicle.garage_id == garage_id)
-        .where(Vehicle.customer_id == customer_id)
-        .where(Booking.status == "CANCELLED")
-    ) or 0
-
-    completed_job_cards = db.scalar(
-        select(func.count(JobCard.id))
-        .select_from(JobCard)
-        .join(
-            Booking,
+        .outerjoin(
+            JobCard,
             and_(
                 JobCard.booking_id == Booking.id,
                 JobCard.garage_id == Booking.garage_id,
             ),
         )
-        .join(
-            Vehicle,
-            and_(
-                Booking.vehicle_id == Vehicle.id,
-                Booking.garage_id == Vehicle.garage_id,
-            ),
-        )
-        .where(JobCard.garage_id == garage_id)
         .where(Booking.garage_id == garage_id)
         .where(Vehicle.garage_id == garage_id)
         .where(Vehicle.customer_id == customer_id)
-        .where(JobCard.status == "COMPLETED")
-    ) or 0
+    ).one()
 
-    customer.health_score = (
+    health_score = (
         int(completed_bookings) * COMPLETED_BOOKING_SCORE
         + int(cancelled_bookings) * CANCELLED_BOOKING_SCORE
         + int(completed_job_cards) * COMPLETED_JOBCARD_SCORE
     )
+
+    # Write the score directly rather than loading the Customer just to set
+    # one column; a Customer already in the session is kept in sync.
+    result = db.execute(
+        update(Customer)
+        .where(Customer.id == customer_id)
+        .where(Customer.garage_id == garage_id)
+        .values(health_score=health_score)
+    )
+    if result.rowcount == 0:
+        raise ValueError("Customer not found.")
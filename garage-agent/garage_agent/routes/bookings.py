@@ -3,7 +3,7 @@ from datetime import date
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from sqlalchemy import func, select
-from sqlalchemy.orm import Session, contains_eager
+from sqlalchemy.orm import Session, contains_eager, raiseload
 
 from garage_agent.db.bootstrap import (
     resolve_default_garage_context,
@@ -59,7 +59,10 @@ def list_bookings(
         select(Booking)
         .join(Booking.vehicle)
         .join(Vehicle.customer)
-        .options(contains_eager(Booking.vehicle).contains_eager(Vehicle.customer))
+        .options(
+            contains_eager(Booking.vehicle).contains_eager(Vehicle.customer),
+            raiseload("*"),
+        )
         .where(Booking.garage_id == garage_id)
     )
 
@@ -192,6 +195,7 @@ def reschedule_booking(
 
     booking = db.scalar(
         select(Booking)
+        .options(raiseload("*"))
         .where(Booking.id == request.booking_id)
         .where(Booking.garage_id == garage_id)
     )
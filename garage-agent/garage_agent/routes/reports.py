@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from garage_agent.db.models import User
-from garage_agent.db.session import SessionLocal
+from garage_agent.db.session import get_db
 from garage_agent.core.security import require_role
 from garage_agent.core.response import success_response
 from garage_agent.services.report_service import get_daily_summary
@@ -14,14 +14,6 @@ from garage_agent.services.report_service import get_daily_summary
 router = APIRouter(prefix="/reports", tags=["Reports"])
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 @router.get("/daily")
 def daily_report(
     report_date: date | None = Query(
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Form, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 from datetime import datetime, timezone
 
 from garage_agent.db.session import get_db
@@ -19,6 +19,7 @@ def twilio_status_callback(
     # risk exists here.  The lookup is safe without an explicit garage_id filter.
     booking = (
         db.query(Booking)
+        .options(raiseload("*"))
         .filter(Booking.reminder_message_sid == MessageSid)
         .first()
     )
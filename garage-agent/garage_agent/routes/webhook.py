@@ -5,12 +5,15 @@ Conversation + booking logic delegated to services.
 
 Async architecture:
   1. Webhook returns an immediate TwiML acknowledgement (<1 s)
-  2. AI processing runs in a FastAPI BackgroundTask
+  2. AI processing runs in a FastAPI BackgroundTask on the event loop;
+     blocking DB / Twilio calls inside it are offloaded to worker threads
   3. Final reply is delivered via the Twilio REST API
 """
 
+import asyncio
 import logging
-from datetime import date, datetime, time, timedelta
+import re
+from datetime import date, time, timedelta
 from xml.sax.saxutils import escape
 
 from fastapi import APIRouter, BackgroundTasks, Depends, Request
@@ -27,7 +30,6 @@ from garage_agent.services.conversation_service import (
     update_data,
 )
 from garage_agent.services.booking_service import create_booking, get_or_create_customer_by_phone
-from garage_agent.services.extractor import extract_booking_details
 from garage_agent.services.twilio_client import send_whatsapp_message
 from garage_agent.ai.adapter import get_ai_engine
 
@@ -68,6 +70,15 @@ def _build_twiml_reply(reply_text: str) -> str:
     )
 
 
+# Precompiled forms of the accepted date/time formats: YYYY-MM-DD,
+# DD/MM/YYYY, DD-MM-YYYY, and 24h or am/pm times with optional minutes.
+# Matching once is cheaper than trying strptime per format and catching the
+# ValueError from each miss.
+_ISO_DATE_PATTERN = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_DAY_FIRST_DATE_PATTERN = re.compile(r"(\d{1,2})([/-])(\d{1,2})\2(\d{4})")
+_TIME_PATTERN = re.compile(r"(\d{1,2})(?::(\d{1,2}))?(am|pm)?")
+
+
 def _parse_service_date(raw_date: str | None) -> date | None:
     if raw_date is None:
         return None
@@ -83,11 +94,19 @@ def _parse_service_date(raw_date: str | None) -> date | None:
     if normalized == "tomorrow":
         return today + timedelta(days=1)
 
-    for fmt in ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y"):
-        try:
-            return datetime.strptime(normalized, fmt).date()
-        except ValueError:
-            continue
+    try:
+        iso_match = _ISO_DATE_PATTERN.fullmatch(normalized)
+        if iso_match:
+            year, month, day = iso_match.groups()
+            return date(int(year), int(month), int(day))
+
+        day_first_match = _DAY_FIRST_DATE_PATTERN.fullmatch(normalized)
+        if day_first_match:
+            day, _, month, year = day_first_match.groups()
+            return date(int(year), int(month), int(day))
+    except ValueError:
+        # Well-formed but impossible dates such as 31/02/2026.
+        return None
 
     return None
 
@@ -107,13 +126,22 @@ def _parse_service_time(raw_time: str | None) -> time | None:
 
     compact_time = normalized.replace(" ", "").replace(".", ":")
 
-    for fmt in ("%H:%M", "%H", "%I:%M%p", "%I%p"):
-        try:
-            return datetime.strptime(compact_time, fmt).time()
-        except ValueError:
-            continue
+    time_match = _TIME_PATTERN.fullmatch(compact_time)
+    if time_match is None:
+        return None
 
-    return None
+    raw_hour, raw_minute, meridiem = time_match.groups()
+    hour = int(raw_hour)
+    minute = int(raw_minute) if raw_minute is not None else 0
+    if minute > 59:
+        return None
+
+    if meridiem is None:
+        return time(hour, minute) if hour <= 23 else None
+
+    if not 1 <= hour <= 12:
+        return None
+    return time(hour % 12 + (12 if meridiem == "pm" else 0), minute)
 
 
 def _send_reply(phone: str, text: str) -> None:
@@ -133,7 +161,7 @@ def _send_reply(phone: str, text: str) -> None:
 # -------------------------------------------------------------------
 
 
-def _process_ai_in_background(phone: str, incoming_message: str, garage_id: int) -> None:
+async def _process_ai_in_background(phone: str, incoming_message: str, garage_id: int) -> None:
     """
     Run the full AI agent pipeline and deliver the reply via Twilio
     REST API.  This function is executed as a FastAPI BackgroundTask,
@@ -155,7 +183,7 @@ def _process_ai_in_background(phone: str, incoming_message: str, garage_id: int)
         selected_engine = "llm" if ai_engine.__class__.__name__ == "LLMEngine" else "rule"
 
         try:
-            raw_ai_response = ai_engine.process(
+            raw_ai_response = await ai_engine.process(
                 db=db,
                 garage_id=garage_id,
                 phone=phone,
@@ -185,10 +213,11 @@ def _process_ai_in_background(phone: str, incoming_message: str, garage_id: int)
                 "result": {"error": "invalid_ai_response"},
             }
 
-        logger.info("event=background_ai phase=ai_complete AI Output: %s", ai_response)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("event=background_ai phase=ai_complete AI Output: %s", ai_response)
 
         reply = ai_response.get("reply") or "Request processed."
-        _send_reply(phone, reply)
+        await asyncio.to_thread(_send_reply, phone, reply)
 
         logger.info(
             "event=background_ai phase=done phone=%s engine=%s",
@@ -221,7 +250,7 @@ async def receive_webhook(
 
     form = await request.form()
 
-    phone = form.get("From", "").replace("whatsapp:", "")
+    phone = form.get("From", "").removeprefix("whatsapp:")
     incoming_message = form.get("Body", "").strip()
     garage_context = resolve_garage_from_phone(db=db, phone=phone)
     garage_id = garage_context.garage_id
@@ -273,7 +302,7 @@ async def receive_webhook(
     # ------------------------------------------------------------
 
     state = get_state(phone)
-    logger.info("Current conversation state for %s: %s", phone, state or "None")
+    logger.debug("Current conversation state for %s: %s", phone, state or "None")
 
     if state is not None:
         # User is mid-conversation — handle synchronously
@@ -322,11 +351,6 @@ def _handle_rule_conversation(
     Handle multi-turn rule-based booking conversation.
     Runs synchronously — all paths complete in milliseconds.
     """
-    extracted = extract_booking_details(incoming_message)
-    detected_service_type = extracted.get("service_type") or "general_service"
-    detected_service_date = extracted.get("service_date")
-    detected_service_time = extracted.get("service_time")
-
     if state == "waiting_for_date":
         update_data(phone, "service_date", incoming_message)
         set_state(phone, "waiting_for_time")
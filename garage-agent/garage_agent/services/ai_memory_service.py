@@ -1,8 +1,8 @@
 """Persistent conversation memory for the AI assistant."""
 
-import json
 import logging
 
+import orjson
 from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -19,8 +19,8 @@ def _normalize_messages(messages_json: str | None) -> list[dict[str, str]]:
         return []
 
     try:
-        raw_messages = json.loads(messages_json)
-    except json.JSONDecodeError:
+        raw_messages = orjson.loads(messages_json)
+    except orjson.JSONDecodeError:
         logger.warning("event=conversation_memory phase=invalid_json")
         return []
 
@@ -85,7 +85,7 @@ def save_message(phone: str, garage_id: int, role: str, content: str) -> AIConve
 
         messages = _normalize_messages(conversation.messages_json)
         messages.append({"role": safe_role, "content": safe_content})
-        conversation.messages_json = json.dumps(messages[-_MAX_MESSAGES:])
+        conversation.messages_json = orjson.dumps(messages[-_MAX_MESSAGES:]).decode("utf-8")
 
         db.commit()
         db.refresh(conversation)
@@ -1,9 +1,9 @@
 """Audit logging service – records critical entity lifecycle events."""
 
-import json
 import logging
 from typing import Any
 
+import orjson
 from sqlalchemy.orm import Session
 
 from garage_agent.db.models import AuditLog
@@ -27,7 +27,7 @@ def create_audit_log(
         action_type=action_type,
         entity_type=entity_type,
         entity_id=entity_id,
-        extra=json.dumps(metadata) if metadata else None,
+        extra=orjson.dumps(metadata).decode("utf-8") if metadata else None,
     )
     db.add(log)
     db.commit()
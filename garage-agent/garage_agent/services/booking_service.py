@@ -6,6 +6,7 @@ from sqlalchemy import func, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from garage_agent.db.bootstrap import invalidate_phone_cache
 from garage_agent.db.models import Booking, Customer, Vehicle
 from garage_agent.services.audit_service import create_audit_log
 from garage_agent.intelligence.customer_health import update_customer_health
@@ -62,6 +63,7 @@ def get_or_create_customer_by_phone(db: Session, garage_id: int, phone: str) ->
     )
     db.add(customer)
     db.flush()
+    invalidate_phone_cache(db, phone)
     return customer
 
 
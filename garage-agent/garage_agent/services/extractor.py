@@ -4,24 +4,44 @@ import re
 
 DATE_PATTERN = re.compile(r"\b([0-3]?\d/[0-1]?\d)\b")
 
+# Keywords in priority order; the first keyword present in the message wins,
+# regardless of where it appears.
+SERVICE_TYPE_KEYWORDS: tuple[tuple[str, str], ...] = (
+    ("oil", "oil_change"),
+    ("service", "service"),
+    ("repair", "repair"),
+)
+RELATIVE_DATE_KEYWORDS: tuple[str, ...] = ("today", "tomorrow")
+
+# One pass over the message collects every keyword instead of one substring
+# scan per keyword.
+KEYWORD_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in (
+            *(keyword for keyword, _ in SERVICE_TYPE_KEYWORDS),
+            *RELATIVE_DATE_KEYWORDS,
+        )
+    )
+)
+
 
 def extract_booking_details(message: str) -> dict[str, str | None]:
     """Extract service type and service date from a customer message."""
     normalized_message = message.lower()
+    found_keywords = set(KEYWORD_PATTERN.findall(normalized_message))
 
-    if "oil" in normalized_message:
-        service_type = "oil_change"
-    elif "service" in normalized_message:
-        service_type = "service"
-    elif "repair" in normalized_message:
-        service_type = "repair"
-    else:
-        service_type = "general_service"
+    service_type = "general_service"
+    for keyword, keyword_service_type in SERVICE_TYPE_KEYWORDS:
+        if keyword in found_keywords:
+            service_type = keyword_service_type
+            break
 
-    if "today" in normalized_message:
-        service_date: str | None = "today"
-    elif "tomorrow" in normalized_message:
-        service_date = "tomorrow"
+    service_date: str | None = None
+    for keyword in RELATIVE_DATE_KEYWORDS:
+        if keyword in found_keywords:
+            service_date = keyword
+            break
     else:
         date_match = DATE_PATTERN.search(normalized_message)
         service_date = date_match.group(1) if date_match else None
@@ -2,8 +2,13 @@
 
 import os
 import logging
+import threading
+from typing import TYPE_CHECKING
+
 from dotenv import load_dotenv
-from twilio.rest import Client
+
+if TYPE_CHECKING:
+    from twilio.rest import Client
 
 # Load environment variables from .env (for local development)
 load_dotenv()
@@ -22,20 +27,35 @@ if not TWILIO_ACCOUNT_SID or not TWILIO_AUTH_TOKEN:
         "Twilio credentials not set. WhatsApp messaging will fail at runtime."
     )
 
-client: Client | None = None
-if TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN:
-    client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+# The Twilio SDK is heavy to import, so the client is built on first send
+# rather than when this module is imported. Sends run from worker threads
+# (webhook background tasks, the reminder scheduler), hence the lock.
+client: "Client | None" = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> "Client | None":
+    global client
+
+    if client is None and TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN:
+        with _client_lock:
+            if client is None:
+                from twilio.rest import Client
+
+                client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+    return client
 
 
 def send_whatsapp_message(to: str, body: str) -> str:
     """Send a WhatsApp message via Twilio and return the message SID."""
-    if client is None:
+    twilio_client = _get_client()
+    if twilio_client is None:
         raise RuntimeError("Twilio client is not configured.")
 
     if not to.startswith("+"):
         raise ValueError("Phone number must be in E.164 format.")
 
-    message = client.messages.create(
+    message = twilio_client.messages.create(
         from_=TWILIO_WHATSAPP_FROM,
         to=f"whatsapp:{to}",
         body=body,
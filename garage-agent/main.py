@@ -15,11 +15,11 @@ from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 from slowapi.errors import RateLimitExceeded
 
+from garage_agent.ai.adapter import close_ai_engine
 from garage_agent.db.init_db import init_db
 from garage_agent.db.bootstrap import get_default_garage
 from garage_agent.db.session import SessionLocal
 from garage_agent.scheduler.reminder_scheduler import start_scheduler
-from garage_agent.ai.llm_engine import warmup_llm
 from garage_agent.routes import webhook, bookings, twilio_webhook
 from garage_agent.routes import jobcards
 from garage_agent.routes.reports import router as reports_router
@@ -51,7 +51,9 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     logger.info("Database tables initialized.")
 
     # Pre-load the LLM into Ollama's RAM before serving traffic.
-    warmup_llm()
+    from garage_agent.ai.llm_engine import warmup_llm
+
+    await warmup_llm()
 
     db = SessionLocal()
     try:
@@ -74,6 +76,8 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
         scheduler.shutdown(wait=False)
         logger.info("Reminder scheduler shut down.")
 
+    await close_ai_engine()
+
 from garage_agent.core.limiter import limiter
 from garage_agent.core.response import error_response
 